@@ -1,18 +1,27 @@
 import base64
-import json
 import m3u8
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
 from uuid import uuid4
-import xml.etree.ElementTree as ET
 from pywidevine import PSSH, Cdm, Device
 from pywidevine.license_protocol_pb2 import WidevinePsshData
+from urllib3.util.retry import Retry
 from ..constants import WVN_KEY
 from ..otsconfig import config
 from ..runtimedata import account_pool, get_logger
-from ..utils import conv_list_format, make_call
+from ..utils import conv_list_format, json_dumps, json_loads, make_call, prime_call_cache
+
+# lxml is an optional, faster drop-in for parsing TTML lyrics
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 logger = get_logger("api.apple_music")
 BASE_URL = 'https://amp-api.music.apple.com/v1'
@@ -21,12 +30,127 @@ WVN_LICENSE_URL = "https://play.itunes.apple.com/WebObjects/MZPlay.woa/wa/acquir
 # Constants for improved reliability
 DEFAULT_TIMEOUT = 30  # seconds
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # seconds
+RETRY_DELAY = 2  # seconds, exponential backoff factor
+RETRY_JITTER = 0.5  # seconds, spreads out retries from concurrent workers
+RETRY_AFTER_MAX = 30  # seconds, longest a Retry-After header may stall a worker
 TOKEN_EXPIRY_BUFFER = 300  # Refresh token 5 minutes before expiry
+CONNECTION_POOL_HOSTS = 32
+CONNECTION_POOL_MAXSIZE = 64
+PLAYLIST_PAGE_SIZE = 100
+SONG_BATCH_SIZE = 300
+ALBUM_CACHE_SIZE = 256
+MAX_CONCURRENT_REQUESTS = 8
+JS_BUNDLE_CHUNK_SIZE = 65536
+JS_BUNDLE_OVERLAP = 4096  # bytes kept between chunks, longer than any bearer token
+
+INDEX_JS_REGEX = re.compile(r"/(assets/index-legacy[~-][^/]+\.js)")
+BEARER_TOKEN_REGEX = re.compile(rb'eyJh[A-Za-z0-9_\-.]{20,}')
+ARTIST_SPLIT_REGEX = re.compile(r'\s*[,&]\s*')
+ARTWORK_SIZE_REGEX = re.compile(r'\{([wh])\}')
+TTML_P_TAG = '{http://www.w3.org/ns/ttml}p'
+TTML_TIME_REGEX = re.compile(r'(?:(\d+):)?(?:(\d+):)?(\d+)(?:\.(\d+))?s?')
+# Metadata key -> LRC tag, and LRC tag -> setting that enables it
+LRC_METADATA_TAGS = {
+    'title': 'ti',
+    'track_title': 'ti',
+    'tracktitle': 'ti',
+    'artists': 'ar',
+    'album_name': 'al',
+    'album': 'al',
+    'writers': 'au',
+}
+LRC_TAG_SETTINGS = {
+    'ti': 'embed_name',
+    'ar': 'embed_artist',
+    'al': 'embed_album',
+    'au': 'embed_writers',
+}
+LOGIN_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:95.0) Gecko/20100101 Firefox/95.0",
+    "Accept": "application/json",
+    "Accept-Language": 'en-US',
+    "Accept-Encoding": "utf-8",
+    "content-type": "application/json",
+    "x-apple-renewal": "true",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-site",
+    "origin": "https://music.apple.com",
+}
+
+# Parsed album responses shared by every track of the same album
+album_cache = {}
+album_cache_lock = Lock()
+
+# Widevine CDM built once from WVN_KEY, sessions are opened per track
+widevine_cdm = None
+widevine_cdm_lock = Lock()
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After headers up to RETRY_AFTER_MAX."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+def _build_adapter():
+    """Create an adapter with a keep-alive connection pool and transient error retries."""
+    # Only idempotent requests are retried, a license or webPlayback POST may have been processed
+    retry = _CappedRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_DELAY,
+        backoff_jitter=RETRY_JITTER,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    return HTTPAdapter(pool_connections=CONNECTION_POOL_HOSTS, pool_maxsize=CONNECTION_POOL_MAXSIZE, max_retries=retry)
+
+
+# One connection pool shared by every account's session, cookies and headers stay per session
+shared_adapter = _build_adapter()
+
+
+def _build_session():
+    """Create an account session that sends its requests through the shared connection pool."""
+    session = requests.Session()
+    session.mount('https://', shared_adapter)
+    session.mount('http://', shared_adapter)
+    return session
 
 
+# Stream playlists live on CDN hosts that must not see the account's tokens, cookies or params
+cdn_session = _build_session()
+
+
+def _get_widevine_cdm():
+    """Return the shared Widevine CDM, building it on first use."""
+    global widevine_cdm
+    with widevine_cdm_lock:
+        if widevine_cdm is None:
+            widevine_cdm = Cdm.from_device(Device.loads(WVN_KEY))
+        return widevine_cdm
+
+
+def _format_artwork_url(url, width, height):
+    """Fill the {w} and {h} placeholders of an artwork url template in one pass."""
+    size = {'w': str(width), 'h': str(height)}
+    return ARTWORK_SIZE_REGEX.sub(lambda match: size[match.group(1)], url)
+
+
+@lru_cache(maxsize=32)
 def _decode_jwt_payload(token):
-    """Decode JWT token payload without verification (for expiry check only)."""
+    """
+    Decode JWT token payload without verification (for expiry check only).
+    The payload never changes for a given token, so results are memoized.
+    """
     try:
         # JWT format: header.payload.signature
         parts = token.split('.')
@@ -40,7 +164,7 @@ def _decode_jwt_payload(token):
             payload += '=' * padding
 
         decoded = base64.urlsafe_b64decode(payload)
-        return json.loads(decoded)
+        return json_loads(decoded)
     except Exception as e:
         logger.debug(f"Failed to decode JWT: {e}")
         return None
@@ -60,41 +184,6 @@ def _is_token_expired(token):
     return time.time() > (exp - TOKEN_EXPIRY_BUFFER)
 
 
-def _request_with_retry(session, method, url, max_retries=MAX_RETRIES, **kwargs):
-    """Make HTTP request with retry logic and timeout."""
-    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
-
-    last_exception = None
-    for attempt in range(max_retries):
-        try:
-            if method.upper() == 'GET':
-                response = session.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = session.post(url, **kwargs)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            return response
-        except requests.exceptions.Timeout as e:
-            last_exception = e
-            logger.warning(f"Request timeout (attempt {attempt + 1}/{max_retries}): {url}")
-        except requests.exceptions.ConnectionError as e:
-            last_exception = e
-            logger.warning(f"Connection error (attempt {attempt + 1}/{max_retries}): {url}")
-        except requests.exceptions.HTTPError as e:
-            # Don't retry on client errors (4xx)
-            if e.response is not None and 400 <= e.response.status_code < 500:
-                raise
-            last_exception = e
-            logger.warning(f"HTTP error (attempt {attempt + 1}/{max_retries}): {e}")
-
-        if attempt < max_retries - 1:
-            time.sleep(RETRY_DELAY * (attempt + 1))  # Exponential backoff
-
-    raise last_exception or Exception(f"Request failed after {max_retries} attempts: {url}")
-
-
 def apple_music_add_account(media_user_token):
     cfg_copy = config.get('accounts').copy()
     new_user = {
@@ -110,54 +199,70 @@ def apple_music_add_account(media_user_token):
     config.save()
 
 
+def _scrape_bearer_token(session):
+    """Extract the web player bearer token from the Apple Music JavaScript bundle."""
+    # Retrieve token from the homepage with timeout
+    logger.debug("Fetching Apple Music homepage...")
+    home_page = session.get("https://music.apple.com", timeout=DEFAULT_TIMEOUT).text
+
+    # Extract JS bundle path
+    js_match = INDEX_JS_REGEX.search(home_page)
+    if not js_match:
+        raise ValueError("Could not find Apple Music JavaScript bundle. Website structure may have changed.")
+
+    index_js_uri = js_match.group(1)
+    logger.debug(f"Found JS bundle: {index_js_uri}")
+
+    # Stream the bundle as raw bytes and stop once the token shows up, it is
+    # several MB and does not need to be decoded or held in memory
+    with session.get(f"https://music.apple.com/{index_js_uri}", stream=True, timeout=DEFAULT_TIMEOUT) as response:
+        buffer = b''
+        for chunk in response.iter_content(JS_BUNDLE_CHUNK_SIZE):
+            # Keep a tail of the previous chunk so a token split across chunks is still found
+            buffer = buffer[-JS_BUNDLE_OVERLAP:] + chunk
+            token_match = BEARER_TOKEN_REGEX.search(buffer)
+            # A match touching the end of the buffer may continue in the next chunk
+            if token_match and token_match.end() < len(buffer):
+                return token_match.group(0).decode('ascii')
+
+    token_match = BEARER_TOKEN_REGEX.search(buffer)
+    if not token_match:
+        raise ValueError("Could not extract Bearer token from JavaScript bundle.")
+
+    return token_match.group(0).decode('ascii')
+
+
+def _save_bearer_token(account, token):
+    """Persist the bearer token on the account so later logins can skip the scrape."""
+    cfg_copy = config.get('accounts').copy()
+    for _account in cfg_copy:
+        if account['uuid'] == _account['uuid']:
+            _account['login']['bearer_token'] = token
+    account['login']['bearer_token'] = token
+    config.set('accounts', cfg_copy)
+    config.save()
+
+
 def apple_music_login_user(account):
     logger.info('Logging into Apple Music account...')
     try:
-        session = requests.Session()
+        session = _build_session()
         media_user_token = account['login']['media-user-token']
 
         if not media_user_token:
             raise ValueError("Media user token is empty. Please provide a valid token.")
 
         session.cookies.update({'media-user-token': media_user_token})
-        session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:95.0) Gecko/20100101 Firefox/95.0",
-                "Accept": "application/json",
-                "Accept-Language": 'en-US',
-                "Accept-Encoding": "utf-8",
-                "content-type": "application/json",
-                "Media-User-Token": media_user_token,
-                "x-apple-renewal": "true",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-site",
-                "origin": "https://music.apple.com",
-            }
-        )
-
-        # Retrieve token from the homepage with timeout
-        logger.debug("Fetching Apple Music homepage...")
-        home_page = session.get("https://music.apple.com", timeout=DEFAULT_TIMEOUT).text
+        session.headers.update(LOGIN_HEADERS)
+        session.headers["Media-User-Token"] = media_user_token
 
-        # Extract JS bundle path
-        js_match = re.search(r"/(assets/index-legacy[~-][^/]+\.js)", home_page)
-        if not js_match:
-            raise ValueError("Could not find Apple Music JavaScript bundle. Website structure may have changed.")
+        # Reuse the bearer token scraped on a previous login while it is still valid
+        token = account['login'].get('bearer_token')
+        using_cached_token = bool(token) and not _is_token_expired(token)
+        if not using_cached_token:
+            token = _scrape_bearer_token(session)
+            _save_bearer_token(account, token)
 
-        index_js_uri = js_match.group(1)
-        logger.debug(f"Found JS bundle: {index_js_uri}")
-
-        index_js_page = session.get(f"https://music.apple.com/{index_js_uri}", timeout=DEFAULT_TIMEOUT).text
-
-        # Extract Bearer token
-        token_match = re.search('(?=eyJh)(.*?)(?=")', index_js_page)
-        if not token_match:
-            raise ValueError("Could not extract Bearer token from JavaScript bundle.")
-
-        token = token_match.group(1)
         session.headers.update({"authorization": f"Bearer {token}"})
         session.params = {"l": 'en-US'}
 
@@ -165,10 +270,18 @@ def apple_music_login_user(account):
         logger.debug("Fetching account subscription info...")
         account_response = session.get(f'{BASE_URL}/me/account?meta=subscription', timeout=DEFAULT_TIMEOUT)
 
+        if account_response.status_code == 401 and using_cached_token:
+            # The cached bearer token may have been revoked, scrape a fresh one and retry once
+            logger.debug("Account request rejected, refreshing bearer token...")
+            token = _scrape_bearer_token(session)
+            _save_bearer_token(account, token)
+            session.headers.update({"authorization": f"Bearer {token}"})
+            account_response = session.get(f'{BASE_URL}/me/account?meta=subscription', timeout=DEFAULT_TIMEOUT)
+
         if account_response.status_code == 401:
             raise ValueError("Invalid or expired media-user-token. Please get a new token from Apple Music website.")
 
-        account_data = account_response.json()
+        account_data = json_loads(account_response.content)
         storefront = account_data.get('meta', {}).get('subscription', {}).get('storefront')
 
         if not storefront:
@@ -233,92 +346,152 @@ def apple_music_get_token(parsing_index):
     return account_pool[parsing_index]['login']['session']
 
 
+# Search result group -> (item type, attribute shown as 'item_by')
+SEARCH_RESULT_TYPES = {
+    'songs': ('track', 'artistName'),
+    'albums': ('album', 'artistName'),
+    'artists': ('artist', 'name'),
+    'playlists': ('playlist', 'curatorName'),
+}
+
+
 def apple_music_get_search_results(session, search_term, content_types):
-    search_types = []
-    if 'track' in content_types:
-        search_types.append('songs')
-    if 'album' in content_types:
-        search_types.append('albums')
-    if 'artist' in content_types:
-        search_types.append('artists')
-    if 'playlist' in content_types:
-        search_types.append('playlists')
+    search_types = [result for result, (item_type, _) in SEARCH_RESULT_TYPES.items() if item_type in content_types]
 
     params = {}
     params['term'] = search_term
     params['limit'] = config.get("max_search_results")
     params['types'] = ",".join(search_types)
 
-    results = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/search', params=params, session=session, skip_cache=True)
+    storefront = session.cookies.get("itua")
+    results = make_call(f'{BASE_URL}/catalog/{storefront}/search', params=params, session=session, skip_cache=True)
 
     search_results = []
-    for result in results['results']:
-
-        if result == 'songs':
-            for track in results['results']['songs']['data']:
-                search_results.append({
-                    'item_id': track['id'],
-                    'item_name': track['attributes']['name'],
-                    'item_by': track['attributes']['artistName'],
-                    'item_type': "track",
-                    'item_service': "apple_music",
-                    'item_url': track['attributes']['url'],
-                    'item_thumbnail_url': track.get("attributes", {}).get("artwork", {}).get("url").replace("{w}", "160").replace("{h}", "160")
-                })
-
-        if result == 'albums':
-            for album in results['results']['albums']['data']:
-                search_results.append({
-                    'item_id': album['id'],
-                    'item_name': album['attributes']['name'],
-                    'item_by': album['attributes']['artistName'],
-                    'item_type': "album",
-                    'item_service': "apple_music",
-                    'item_url': album['attributes']['url'],
-                    'item_thumbnail_url': album.get("attributes", {}).get("artwork", {}).get("url").replace("{w}", "160").replace("{h}", "160")
-                })
-
-        if result == 'artists':
-            for artist in results['results']['artists']['data']:
-                search_results.append({
-                    'item_id': artist['id'],
-                    'item_name': artist['attributes']['name'],
-                    'item_by': artist['attributes']['name'],
-                    'item_type': "artist",
-                    'item_service': "apple_music",
-                    'item_url': artist['attributes']['url'],
-                    'item_thumbnail_url': artist.get("attributes", {}).get("artwork", {}).get("url").replace("{w}", "160").replace("{h}", "160")
-                })
-
-        if result == 'playlists':
-            for playlist in results['results']['playlists']['data']:
-                search_results.append({
-                    'item_id': playlist['id'],
-                    'item_name': playlist['attributes']['name'],
-                    'item_by': playlist['attributes'].get('curatorName'),
-                    'item_type': "playlist",
-                    'item_service': "apple_music",
-                    'item_url': playlist['attributes']['url'],
-                    'item_thumbnail_url': playlist.get("attributes", {}).get("artwork", {}).get("url").replace("{w}", "160").replace("{h}", "160")
-                })
+    for result, result_data in results['results'].items():
+        if result not in SEARCH_RESULT_TYPES:
+            continue
+        item_type, item_by_key = SEARCH_RESULT_TYPES[result]
+        search_results.extend({
+            'item_id': item['id'],
+            'item_name': item['attributes']['name'],
+            'item_by': item['attributes'].get(item_by_key),
+            'item_type': item_type,
+            'item_service': "apple_music",
+            'item_url': item['attributes']['url'],
+            'item_thumbnail_url': _format_artwork_url(item['attributes'].get("artwork", {}).get("url"), 160, 160)
+        } for item in result_data['data'])
 
     return search_results
 
 
-def apple_music_get_track_metadata(session, item_id):
-    logger.debug(f"Fetching metadata for track: {item_id}")
+def _get_album_data(session, album_id):
+    """
+    Return album data and a {track id: position} index, fetching and indexing
+    the album only once for all of its tracks.
+    """
+    storefront = session.cookies.get("itua")
+    cache_key = (storefront, album_id)
+    with album_cache_lock:
+        cached_album = album_cache.get(cache_key)
+    if cached_album is not None:
+        return cached_album
+
+    album_data = make_call(f'{BASE_URL}/catalog/{storefront}/albums/{album_id}', session=session)
+    if not album_data:
+        return album_data, {}
+
+    track_numbers = {}
+    for i, track in enumerate(album_data.get('data', [])[0].get('relationships', {}).get('tracks', {}).get('data', [])):
+        track_numbers.setdefault(track.get('id'), i + 1)
+
+    with album_cache_lock:
+        if len(album_cache) >= ALBUM_CACHE_SIZE:
+            album_cache.pop(next(iter(album_cache)))
+        album_cache[cache_key] = (album_data, track_numbers)
+    return album_data, track_numbers
+
+
+def apple_music_get_songs_batch(session, item_ids):
+    """Fetch catalog data for many songs with the multi-get endpoint, keyed by song id."""
+    item_ids = list(item_ids)
+    songs = {}
+    for i in range(0, len(item_ids), SONG_BATCH_SIZE):
+        params = {}
+        params['ids'] = ','.join(item_ids[i:i + SONG_BATCH_SIZE])
+        params['include'] = 'lyrics'
+        batch_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/songs', params=params, session=session, skip_cache=True)
+        if batch_data:
+            for song in batch_data.get('data', []):
+                songs[song.get('id')] = song
+    return songs
+
+
+def _prefetch_album(session, album_id):
+    try:
+        _get_album_data(session, album_id)
+    except Exception as e:
+        logger.debug(f"Could not prefetch album {album_id}: {e}")
+
+
+def _prefetch_songs(session, item_ids):
+    """
+    Warm the request cache so per-track metadata and lyrics lookups skip their
+    own GET, and fetch the albums those songs belong to concurrently unless
+    stealth mode is on.
+    """
+    try:
+        songs = apple_music_get_songs_batch(session, item_ids)
+    except Exception as e:
+        logger.warning(f"Could not batch fetch song data, falling back to per-track requests: {e}")
+        return
+
+    storefront = session.cookies.get("itua")
+    album_ids = {}
+    for song_id, song in songs.items():
+        prime_call_cache(f'{BASE_URL}/catalog/{storefront}/songs/{song_id}', {'data': [song]})
+        for album in song.get('relationships', {}).get('albums', {}).get('data', [])[:1]:
+            album_ids[album.get('id')] = None
+
+    # A burst of concurrent album requests is what stealth mode avoids, the tracks
+    # then fetch their albums one at a time as they are queued
+    if config.get('stealth_mode_enabled'):
+        return
+
+    with album_cache_lock:
+        album_ids = [album_id for album_id in album_ids if album_id and (storefront, album_id) not in album_cache]
+    # Albums past the cache size would be evicted before their tracks read them
+    album_ids = album_ids[:ALBUM_CACHE_SIZE]
+    if album_ids:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            list(executor.map(lambda album_id: _prefetch_album(session, album_id), album_ids))
+
+
+def _get_song_data(session, item_id):
+    """
+    Fetch a song with its lyrics relationship. Metadata and lyrics share this
+    request so the lyrics lookup is served from the request cache.
+    """
     params = {}
     params['include'] = 'lyrics'
-    track_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/songs/{item_id}', params=params, session=session)
+    return make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/songs/{item_id}', params=params, session=session)
+
+
+def apple_music_get_track_metadata(session, item_id):
+    logger.debug(f"Fetching metadata for track: {item_id}")
+    track_data = _get_song_data(session, item_id)
 
     # Validate track data
     if not track_data.get('data'):
         raise ValueError(f"No data returned for track {item_id}. Track may not exist or be unavailable in your region.")
 
+    track = track_data['data'][0]
+    track_attrs = track.get('attributes') or {}
+
     album_data = None
+    track_numbers = {}
     try:
-        album_id = track_data.get('data', [])[0].get('relationships', {}).get('albums', {}).get('data', [])[0].get('id', {})
-        album_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/albums/{album_id}', session=session)
+        album_id = track.get('relationships', {}).get('albums', {}).get('data', [])[0].get('id', {})
+        album_data, track_numbers = _get_album_data(session, album_id)
     except (IndexError, KeyError, TypeError) as e:
         logger.warning(f"Could not fetch album data for track {item_id}: {e}")
         album_data = None
@@ -327,68 +500,64 @@ def apple_music_get_track_metadata(session, item_id):
         album_data = None
 
     # Artists
-    artists = []
-    artist_name = track_data.get('data', [])[0].get('attributes', {}).get('artistName', '')
-    if artist_name:
-        for artist in artist_name.replace("&", ",").split(","):
-            artists.append(artist.strip())
+    artists = [artist for artist in ARTIST_SPLIT_REGEX.split(track_attrs.get('artistName', '').strip()) if artist]
 
     info = {}
-    info['item_id'] = track_data.get('data', [])[0].get('id')
-    info['album_name'] = track_data.get('data', [])[0].get('attributes', {}).get('albumName')
-    info['genre'] = conv_list_format(track_data.get('data', [])[0].get('attributes', {}).get('genreNames', []))
+    info['item_id'] = track.get('id')
+    info['album_name'] = track_attrs.get('albumName')
+    info['genre'] = conv_list_format(track_attrs.get('genreNames', []))
 
     # Release year extraction with logging
     try:
-        release_date = track_data.get('data', [])[0].get('attributes', {}).get('releaseDate')
+        release_date = track_attrs.get('releaseDate')
         if release_date:
             info['release_year'] = release_date.split('-')[0]
     except (AttributeError, IndexError) as e:
         logger.debug(f"Could not extract release year for track {item_id}: {e}")
-    info['length'] = str(track_data.get('data', [])[0].get('attributes', {}).get('durationInMillis'))
-    info['isrc'] = track_data.get('data', [])[0].get('attributes', {}).get('isrc')
-
-    image_url = track_data.get('data', [])[0].get('attributes', {}).get('artwork', {}).get('url')
-    max_height = track_data.get('data', [])[0].get('attributes', {}).get('artwork', {}).get('height')
-    max_width = track_data.get('data', [])[0].get('attributes', {}).get('artwork', {}).get('width')
-    info['image_url'] = image_url.replace("{w}", str(max_width)).replace("{h}", str(max_height))
-
-    info['writer'] = track_data.get('data', [])[0].get('attributes', {}).get('composerName')
-    info['language'] = track_data.get('data', [])[0].get('attributes', {}).get('audioLocale')
-    info['item_url'] = track_data.get('data', [])[0].get('attributes', {}).get('url')
-    info['is_playable'] = True if track_data.get('data', [])[0].get('attributes', {}).get('playParams') else False
-    info['disc_number'] = track_data.get('data', [])[0].get('attributes', {}).get('discNumber')
-    info['title'] = track_data.get('data', [])[0].get('attributes', {}).get('name')
-    info['explicit'] = True if track_data.get('data', [])[0].get('attributes', {}).get('contentRating') == 'explicit' else False
+    info['length'] = str(track_attrs.get('durationInMillis'))
+    info['isrc'] = track_attrs.get('isrc')
+
+    artwork = track_attrs.get('artwork') or {}
+    image_url = artwork.get('url')
+    max_height = artwork.get('height')
+    max_width = artwork.get('width')
+    info['image_url'] = _format_artwork_url(image_url, max_width, max_height)
+
+    info['writer'] = track_attrs.get('composerName')
+    info['language'] = track_attrs.get('audioLocale')
+    info['item_url'] = track_attrs.get('url')
+    info['is_playable'] = True if track_attrs.get('playParams') else False
+    info['disc_number'] = track_attrs.get('discNumber')
+    info['title'] = track_attrs.get('name')
+    info['explicit'] = True if track_attrs.get('contentRating') == 'explicit' else False
     info['artists'] = conv_list_format(artists)
 
     info['album_artists'] = artists[0]
 
     if album_data:
-        info['copyright'] = album_data.get('data', [])[0].get('attributes', {}).get('copyright')
-        info['upc'] = album_data.get('data', [])[0].get('attributes', {}).get('upc')
-        info['label'] = album_data.get('data', [])[0].get('attributes', {}).get('recordLabel')
-        info['total_tracks'] = album_data.get('data', [])[0].get('attributes', {}).get('trackCount')
+        album = album_data['data'][0]
+        album_attrs = album.get('attributes') or {}
+        album_tracks = album.get('relationships', {}).get('tracks', {}).get('data', [])
+
+        info['copyright'] = album_attrs.get('copyright')
+        info['upc'] = album_attrs.get('upc')
+        info['label'] = album_attrs.get('recordLabel')
+        info['total_tracks'] = album_attrs.get('trackCount')
 
         album_type = 'album'
-        if album_data.get('data', [])[0].get('attributes', {}).get('isSingle'):
+        if album_attrs.get('isSingle'):
             album_type = 'single'
-        if album_data.get('data', [])[0].get('attributes', {}).get('isCompilation'):
+        if album_attrs.get('isCompilation'):
             album_type = 'compilation'
         info['album_type'] = album_type
 
         # Track Number
-        track_number = None
-
-        for i, track in enumerate(album_data.get('data', [])[0].get('relationships', {}).get('tracks', {}).get('data', [])):
-            if track.get('id') == str(item_id):
-                track_number = i + 1
-                break
+        track_number = track_numbers.get(str(item_id))
         if not track_number:
-            track_number = track_data.get('data', [])[0].get('attributes', {}).get('trackNumber')
+            track_number = track_attrs.get('trackNumber')
 
         # Total Discs
-        total_discs = album_data.get('data', [])[0].get('relationships', {}).get('tracks', {}).get('data', [])[-1].get('attributes', {}).get('discNumber')
+        total_discs = album_tracks[-1].get('attributes', {}).get('discNumber')
 
         info['track_number'] = track_number
         info['total_discs'] = total_discs
@@ -397,65 +566,57 @@ def apple_music_get_track_metadata(session, item_id):
 
 
 def apple_music_get_lyrics(session, item_id, item_type, metadata, filepath):
-    params = {}
-    params['include'] = 'lyrics'
-    track_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/songs/{item_id}', params=params, session=session)
+    # Nothing would consume the lyrics, skip the request and TTML parsing
+    if not config.get('save_lrc_file') and not config.get('embed_lyrics'):
+        return False
 
-    time_synced = track_data.get('data', [])[0].get('attributes', {}).get('hasTimeSyncedLyrics')
+    track_data = _get_song_data(session, item_id)
+
+    track = track_data['data'][0]
+    time_synced = (track.get('attributes') or {}).get('hasTimeSyncedLyrics')
     if config.get('only_download_synced_lyrics') and not time_synced:
         return False
 
-    if len(track_data.get('data', [])[0].get('relationships', {}).get('lyrics', {}).get('data', [])):
-        ttml_data = track_data.get('data', [])[0].get('relationships', {}).get('lyrics', {}).get('data', [])[0].get('attributes', {}).get('ttml')
+    lyrics_data = track.get('relationships', {}).get('lyrics', {}).get('data') or []
+    if lyrics_data:
+        ttml_data = (lyrics_data[0].get('attributes') or {}).get('ttml')
+        if '`' in ttml_data:
+            ttml_data = ttml_data.replace('`', '')
         lyrics_list = []
 
         if not config.get('only_download_plain_lyrics'):
             if config.get("embed_branding"):
                 lyrics_list.append('[re:OnTheSpot]')
 
-            for key in metadata.keys():
-                value = metadata[key]
-                if key in ['title', 'track_title', 'tracktitle'] and config.get("embed_name"):
-                    lyrics_list.append(f'[ti:{value}]')
-                elif key == 'artists' and config.get("embed_artist"):
-                    lyrics_list.append(f'[ar:{value}]')
-                elif key in ['album_name', 'album'] and config.get("embed_album"):
-                    lyrics_list.append(f'[al:{value}]')
-                elif key in ['writers'] and config.get("embed_writers"):
-                    lyrics_list.append(f'[au:{value}]')
+            embed_tags = {tag: config.get(setting) for tag, setting in LRC_TAG_SETTINGS.items()}
+            for key, value in metadata.items():
+                tag = LRC_METADATA_TAGS.get(key)
+                if tag and embed_tags[tag]:
+                    lyrics_list.append(f'[{tag}:{value}]')
 
             if config.get("embed_length"):
-                l_ms = int(metadata['length'])
-                if round((l_ms/1000)/60) < 10:
-                    digit="0"
-                else:
-                    digit=""
-                lyrics_list.append(f'[length:{digit}{str((l_ms/1000)/60)[:1]}:{round((l_ms/1000)%60)}]\n')
+                minutes, seconds = divmod(int(metadata['length']) // 1000, 60)
+                lyrics_list.append(f'[length:{minutes:02}:{seconds:02}]\n')
 
         default_length = len(lyrics_list)
 
-        for p in ET.fromstring(ttml_data.replace('`', '')).findall('.//{http://www.w3.org/ns/ttml}p'):
-            begin_time = p.attrib.get('begin')
+        plain_lyrics = config.get('only_download_plain_lyrics')
+        for p in ET.fromstring(ttml_data.encode('utf-8')).iter(TTML_P_TAG):
             lyric = p.text
             if lyric:
                 if time_synced:
-                    if ':' in begin_time:
-                        time_parts = begin_time.split(':')
-                        if len(time_parts) == 3:  # Format: HH:MM:SS.mmm
-                            hours, minutes, seconds = time_parts
-                            minutes = int(minutes) + (int(hours) * 60)
-                        elif len(time_parts) == 2:  # Format: MM:SS.mmm
-                            minutes, seconds = time_parts
-                    else: # Format: SS.mmm
-                        minutes = '0'
-                        seconds = begin_time
-                    try:
-                        seconds, milliseconds = seconds.split('.')
-                    except (TypeError, ValueError):
-                        milliseconds = '0'
-                    formatted_time = f"{int(minutes):02}:{int(seconds):02}.{milliseconds.replace('s', '')[:2]}"
-                    if not config.get('only_download_plain_lyrics'):
-                        lyric = f'[{formatted_time}] {lyric}'
+                    # Formats: HH:MM:SS.mmm, MM:SS.mmm, SS.mmm
+                    time_match = TTML_TIME_REGEX.fullmatch(p.attrib.get('begin') or '')
+                    if time_match and not plain_lyrics:
+                        first, second, seconds, fraction = time_match.groups()
+                        total_seconds = int(seconds) + float(f'0.{fraction or 0}')
+                        if second is not None:
+                            total_seconds += int(first) * 3600 + int(second) * 60
+                        elif first is not None:
+                            total_seconds += int(first) * 60
+                        minutes, centiseconds = divmod(round(total_seconds * 100), 6000)
+                        seconds, centiseconds = divmod(centiseconds, 100)
+                        lyric = f'[{minutes:02}:{seconds:02}.{centiseconds:02}] {lyric}'
 
                 lyrics_list.append(lyric)
 
@@ -481,11 +642,11 @@ def apple_music_get_webplayback_info(session, item_id):
     try:
         response = session.post(
             'https://play.itunes.apple.com/WebObjects/MZPlay.woa/wa/webPlayback',
-            json=payload,
+            data=json_dumps(payload),
             timeout=DEFAULT_TIMEOUT
         )
         response.raise_for_status()
-        webplayback_info = response.json()
+        webplayback_info = json_loads(response.content)
     except requests.exceptions.Timeout:
         raise Exception(f"Timeout getting playback info for track {item_id}")
     except requests.exceptions.HTTPError as e:
@@ -515,9 +676,11 @@ def apple_music_get_decryption_key(session, stream_url, item_id):
     """Extract DRM decryption key using Widevine CDM."""
     logger.debug(f"Getting decryption key for track: {item_id}")
 
-    # Load m3u8 playlist
+    # Load m3u8 playlist over the shared connection pool, without the account's credentials
     try:
-        m3u8_obj = m3u8.load(stream_url, verify_ssl=False)
+        playlist_response = cdn_session.get(stream_url, timeout=DEFAULT_TIMEOUT)
+        playlist_response.raise_for_status()
+        m3u8_obj = m3u8.loads(playlist_response.text, uri=stream_url)
     except Exception as e:
         raise Exception(f"Failed to load m3u8 playlist for track {item_id}: {e}")
 
@@ -544,7 +707,7 @@ def apple_music_get_decryption_key(session, stream_url, item_id):
             raise Exception(f"Invalid PSSH format for track {item_id}: {e}")
 
         pssh_obj = PSSH(widevine_pssh_data.SerializeToString())
-        cdm = Cdm.from_device(Device.loads(WVN_KEY))
+        cdm = _get_widevine_cdm()
 
         cdm_session = cdm.open()
         challenge = base64.b64encode(
@@ -564,9 +727,9 @@ def apple_music_get_decryption_key(session, stream_url, item_id):
         logger.debug(f"Requesting license for track {item_id}")
 
         try:
-            license_response = session.post(WVN_LICENSE_URL, json=license_payload, timeout=DEFAULT_TIMEOUT)
+            license_response = session.post(WVN_LICENSE_URL, data=json_dumps(license_payload), timeout=DEFAULT_TIMEOUT)
             license_response.raise_for_status()
-            license_data = license_response.json()
+            license_data = json_loads(license_response.content)
         except requests.exceptions.Timeout:
             raise Exception(f"Timeout requesting license for track {item_id}")
         except requests.exceptions.HTTPError as e:
@@ -604,11 +767,10 @@ def apple_music_get_decryption_key(session, stream_url, item_id):
 
 def apple_music_get_album_track_ids(session, album_id):
     logger.info(f"Getting tracks from album: {album_id}")
-    album_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/albums/{album_id}', session=session)
-    item_ids = []
-    for track in album_data.get('data', [])[0].get('relationships', {}).get('tracks', {}).get('data', []):
-        if track['type'] == 'songs':
-            item_ids.append(track['id'])
+    album_data, _ = _get_album_data(session, album_id)
+    tracks = album_data.get('data', [])[0].get('relationships', {}).get('tracks', {}).get('data', [])
+    item_ids = [track['id'] for track in tracks if track['type'] == 'songs']
+    _prefetch_songs(session, item_ids)
     return item_ids
 
 
@@ -621,28 +783,40 @@ def apple_music_get_artist_album_ids(session, artist_id):
 
     album_data = make_call(f'{BASE_URL}/catalog/{session.cookies.get("itua")}/artists/{artist_id}', params=params, session=session)
 
-    item_ids = []
-    for album in album_data.get('data', [])[0].get('relationships', {}).get('albums', {}).get('data', []):
-        item_ids.append(album.get('id'))
-    return item_ids
+    albums = album_data.get('data', [])[0].get('relationships', {}).get('albums', {}).get('data', [])
+    return [album.get('id') for album in albums]
 
 
 def apple_music_get_playlist_data(session, playlist_id):
     logger.info(f"Get playlist data for playlist: {playlist_id}")
     playlist_data = make_call(f"{BASE_URL}/catalog/{session.cookies.get('itua')}/playlists/{playlist_id}", session=session, skip_cache=True)
-    playlist_name = playlist_data.get('data', [])[0].get('attributes', {}).get('name')
-    playlist_by =  playlist_data.get('data', [])[0].get('attributes', {}).get('curatorName')
-
-    track_ids = []
-    offset = 0
-    while True:
-        url = f'{BASE_URL}/catalog/{session.cookies.get("itua")}/playlists/{playlist_id}/tracks?offset={offset}'
-        playlist_track_data = make_call(url, session=session, skip_cache=True)
-        for track in playlist_track_data.get('data'):
-            track_ids.append(track.get('id'))
-        if 'next' in playlist_track_data:
-            offset += 100
+    playlist_attrs = playlist_data['data'][0].get('attributes') or {}
+    playlist_name = playlist_attrs.get('name')
+    playlist_by = playlist_attrs.get('curatorName')
+
+    tracks_url = f'{BASE_URL}/catalog/{session.cookies.get("itua")}/playlists/{playlist_id}/tracks'
+
+    # Probe the first page to learn the playlist size, then fetch the
+    # remaining pages concurrently instead of walking 'next' links one by one.
+    # Stealth mode keeps the sequential walk, it avoids bursts of requests.
+    first_page = make_call(f'{tracks_url}?offset=0', session=session, skip_cache=True)
+    pages = [first_page]
+    if 'next' in first_page:
+        total = first_page.get('meta', {}).get('total')
+        if total and not config.get('stealth_mode_enabled'):
+            offsets = range(PLAYLIST_PAGE_SIZE, total, PLAYLIST_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                pages.extend(executor.map(
+                    lambda offset: make_call(f'{tracks_url}?offset={offset}', session=session, skip_cache=True),
+                    offsets
+                ))
         else:
-            break
+            offset = 0
+            while 'next' in pages[-1]:
+                offset += PLAYLIST_PAGE_SIZE
+                pages.append(make_call(f'{tracks_url}?offset={offset}', session=session, skip_cache=True))
+
+    track_ids = [track.get('id') for page in pages for track in page.get('data', [])]
 
+    _prefetch_songs(session, track_ids)
     return playlist_name, playlist_by, track_ids
@@ -1,4 +1,5 @@
 from hashlib import md5
+from functools import lru_cache
 import json
 import os
 from yt_dlp import YoutubeDL, extractor
@@ -71,6 +72,7 @@ def generic_get_track_metadata(_, url):
     return info
 
 
+@lru_cache(maxsize=1)
 def generic_list_extractors():
     extractors = extractor.gen_extractors()
     extractor_list = []
@@ -11,7 +11,7 @@ from librespot.core import Session
 from librespot.zeroconf import ZeroconfServer
 from PyQt6.QtCore import QObject
 from ..otsconfig import config, cache_dir
-from ..runtimedata import get_logger, account_pool, pending, download_queue, pending_lock
+from ..runtimedata import get_logger, account_pool, pending, download_queue, pending_lock, notify_pending
 from ..utils import make_call, conv_list_format
 
 logger = get_logger("api.spotify")
@@ -98,6 +98,7 @@ class MirrorSpotifyPlayback(QObject):
                                 'playlist_by': playlist_by,
                                 'playlist_number': '?'
                             }
+                            notify_pending()
                         logger.info(f'Mirror Spotify Playback added track to download queue: https://open.spotify.com/track/{item_id}')
                         continue
                 else:
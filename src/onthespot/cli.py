@@ -23,8 +23,9 @@ from .api.crunchyroll import crunchyroll_get_episode_metadata, crunchyroll_add_a
 from .downloader import DownloadWorker, RetryWorker
 from .otsconfig import config_dir, config
 from .parse_item import parsingworker, parse_url
-from .runtimedata import account_pool, pending, download_queue, download_queue_lock, pending_lock
+from .runtimedata import account_pool, pending, download_queue, download_queue_lock, pending_condition, get_ready_pending_id, retry_pending_item
 from .search import get_search_results
+from .stealth import flush_stats
 
 if not config.get('debug_mode'):
     logging.disable(logging.CRITICAL)
@@ -50,36 +51,36 @@ class QueueWorker(threading.Thread):
 
     def run(self):
         while True:
+            with pending_condition:
+                local_id = get_ready_pending_id()
+                while local_id is None:
+                    # Items backing off after a failure are rechecked every second
+                    pending_condition.wait(1 if pending else None)
+                    local_id = get_ready_pending_id()
+                item = pending.pop(local_id)
             try:
-                if pending:
-                    local_id = next(iter(pending))
-                    with pending_lock:
-                        item = pending.pop(local_id)
-                    token = get_account_token(item['item_service'])
-                    item_metadata = globals()[f"{item['item_service']}_get_{item['item_type']}_metadata"](token, item['item_id'])
-                    if item_metadata:
-                        with download_queue_lock:
-                            download_queue[local_id] = {
-                                'local_id': local_id,
-                                'available': True,
-                                "item_service": item["item_service"],
-                                "item_type": item["item_type"],
-                                'item_id': item['item_id'],
-                                'item_status': 'Waiting',
-                                "file_path": None,
-                                "item_name": item_metadata["title"],
-                                "item_by": item_metadata["artists"],
-                                'parent_category': item['parent_category'],
-                                'playlist_name': item.get('playlist_name'),
-                                'playlist_by': item.get('playlist_by'),
-                                'playlist_number': item.get('playlist_number')
-                                }
-                else:
-                    time.sleep(0.2)
+                token = get_account_token(item['item_service'])
+                item_metadata = globals()[f"{item['item_service']}_get_{item['item_type']}_metadata"](token, item['item_id'])
+                if item_metadata:
+                    with download_queue_lock:
+                        download_queue[local_id] = {
+                            'local_id': local_id,
+                            'available': True,
+                            "item_service": item["item_service"],
+                            "item_type": item["item_type"],
+                            'item_id': item['item_id'],
+                            'item_status': 'Waiting',
+                            "file_path": None,
+                            "item_name": item_metadata["title"],
+                            "item_by": item_metadata["artists"],
+                            'parent_category': item['parent_category'],
+                            'playlist_name': item.get('playlist_name'),
+                            'playlist_by': item.get('playlist_by'),
+                            'playlist_number': item.get('playlist_number')
+                            }
             except Exception as e:
                 logger.error(f"Unknown Exception for {item}: {str(e)}\nTraceback: {traceback.format_exc()}")
-                with pending_lock:
-                    pending[local_id] = item
+                retry_pending_item(item)
 
 
 def main():
@@ -129,6 +130,8 @@ def main():
                     print(f"\033[31mItem ID {item['item_id']} {item['item_status']}'\033[0m")
                     failed_download = True
 
+        # os._exit skips atexit handlers
+        flush_stats()
         if failed_download:
             print("\033[31mAt least one track download failed. Exiting with failure...\033[0m")
             os._exit(1)
@@ -527,6 +530,7 @@ class CLI(Cmd):
     def do_exit(self, arg):
         """Exit the CLI application."""
         print("Exiting the CLI application.")
+        flush_stats()
         os._exit(0)
 
 
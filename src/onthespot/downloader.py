@@ -192,7 +192,8 @@ class DownloadWorker(QObject):
                         dl_root = config.get("video_download_path")
                     if temp_download_path:
                         dl_root = temp_download_path[0]
-                    file_path = os.path.join(dl_root, item_path)
+                    # Absolute once here so the gui actions can use the stored path directly
+                    file_path = os.path.abspath(os.path.join(dl_root, item_path))
                     directory, file_name = os.path.split(file_path)
 
                     # Additional verification of path length limits, see https://learn.microsoft.com/en-us/windows/win32/fileio/maximum-file-path-limitation in case the file_name + directory exceeds the path limit 
@@ -728,7 +729,7 @@ class DownloadWorker(QObject):
                         if self.gui:
                             ydl_opts['progress_hooks'] = [lambda d: self.yt_dlp_progress_hook(item, d)]
                         with YoutubeDL(ydl_opts) as video:
-                            item['file_path'] = video.prepare_filename(video.extract_info(item_id, download=False))
+                            item['file_path'] = os.path.abspath(video.prepare_filename(video.extract_info(item_id, download=False)))
                             video.download(item_id)
 
                 except RuntimeError as e:
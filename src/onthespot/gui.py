@@ -3,31 +3,41 @@ import os
 os.environ['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION'] = 'python'
 
 import sys
-import threading
-from PyQt6.QtCore import QTranslator
+from PyQt6.QtCore import QThread, Qt
 from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QStyle
-from .qt.mainui import MainWindow
-from .qt.minidialog import MiniDialog
+from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from .otsconfig import config
-from .parse_item import parsingworker
-from .runtimedata import get_logger, set_init_tray
-
-# Hot reload support for development
-try:
-    import jurigged
-    HOT_RELOAD_AVAILABLE = True
-except ImportError:
-    HOT_RELOAD_AVAILABLE = False
+from .runtimedata import get_logger, set_init_tray, shutdown_event
+from .stealth import flush_stats
 
 logger = get_logger('gui')
+TRAY_ICON_PATH = os.path.join(config.app_root, 'resources', 'icons', 'onthespot.png')
+tray_icon = None
+
+
+def get_tray_icon():
+    # Decode the icon once, it needs a QApplication so it can't be built at import
+    global tray_icon
+    if tray_icon is None:
+        tray_icon = QIcon(TRAY_ICON_PATH)
+    return tray_icon
+
+
+class ParsingWorker(QThread):
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+
+
+    def run(self):
+        self.target()
 
 
 class TrayApp:
     def __init__(self, main_window):
         self.main_window = main_window
         self.tray_icon = QSystemTrayIcon(self.main_window)
-        self.tray_icon.setIcon(QIcon(os.path.join(config.app_root, 'resources', 'icons', 'onthespot.png')))
+        self.tray_icon.setIcon(get_tray_icon())
         self.tray_icon.setVisible(True)
         tray_menu = QMenu()
         tray_menu.addAction("Show", self.show_window)
@@ -52,26 +62,41 @@ class TrayApp:
 
 
 def main():
+    # Deferred so importing this module stays cheap, the main window pulls in every service api
+    from PyQt6.QtCore import QTranslator
+    from .qt.mainui import MainWindow
+    from .qt.minidialog import MiniDialog
+    from .parse_item import parsingworker
+
     config.migration()
     logger.info(f'OnTheSpot Version: {config.get("version")}')
 
     # Enable hot reload for development - edit code and see changes without restart!
-    if HOT_RELOAD_AVAILABLE:
-        jurigged.watch(pattern="*.py")
-        logger.info("🔥 Hot reload enabled! Edit Python files and save to see changes instantly.")
-
+    if os.environ.get('ONTHESPOT_HOT_RELOAD') == '1':
+        try:
+            import jurigged
+            # Only watch the app's own sources, not every python file under the working directory
+            jurigged.watch(pattern=os.path.join(config.app_root, '*.py'))
+            logger.info("🔥 Hot reload enabled! Edit Python files and save to see changes instantly.")
+        except ImportError:
+            logger.warning("ONTHESPOT_HOT_RELOAD is set but jurigged is not installed.")
+
+    # Row buttons never need native window handles, and progress repaints can be merged
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents)
     app = QApplication(sys.argv)
 
-    translator = QTranslator()
-    path = os.path.join(os.path.join(config.app_root, 'resources', 'translations'),
-                 f"{config.get('language')}.qm")
-    translator.load(path)
-    app.installTranslator(translator)
+    # The ui is written in English, only install a translator when a catalog exists
+    language = config.get('language')
+    path = os.path.join(config.app_root, 'resources', 'translations', f"{language}.qm")
+    if language and language != 'en_US' and os.path.isfile(path):
+        translator = QTranslator(app)
+        if translator.load(path):
+            app.installTranslator(translator)
 
     # Start Item Parser
-    thread = threading.Thread(target=parsingworker)
-    thread.daemon = True
-    thread.start()
+    parser = ParsingWorker(parsingworker)
+    parser.start()
 
     # Check for start URL
     try:
@@ -92,7 +117,14 @@ def main():
     app.setDesktopFileName('org.onthespot.OnTheSpot')
     app.exec()
 
+    # Let the parser finish the item it is on instead of killing it mid-write
+    shutdown_event.set()
+    parser.wait(2000)
+    # os._exit skips atexit handlers
+    flush_stats()
+
     logger.info('Good bye ..')
+    # Queue and download workers are plain threads that may be blocked on network reads
     os._exit(0)
 
 
@@ -0,0 +1,94 @@
+"""
+Metadata Cache - Persist track metadata between sessions
+Lets a restarted queue rebuild its rows without refetching every item.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from .otsconfig import cache_dir
+from .runtimedata import get_logger
+
+logger = get_logger("metadata_cache")
+
+METADATA_DB_TTL = 86400  # seconds, metadata includes availability which can change
+
+_connection = None
+_lock = threading.Lock()
+
+
+def _get_connection():
+    """Open the cache database on first use."""
+    global _connection
+    if _connection is None:
+        os.makedirs(cache_dir(), exist_ok=True)
+        _connection = sqlite3.connect(os.path.join(cache_dir(), 'metadata.db'), check_same_thread=False)
+        _connection.execute('PRAGMA journal_mode=WAL')
+        _connection.execute('PRAGMA synchronous=NORMAL')
+        _connection.execute(
+            'CREATE TABLE IF NOT EXISTS meta(service TEXT, type TEXT, id TEXT, json TEXT, fetched INTEGER, '
+            'PRIMARY KEY(service, type, id))'
+        )
+        _connection.commit()
+    return _connection
+
+
+def get_cached_metadata(service, item_type, item_id):
+    """Return stored metadata for an item, or None if missing or expired."""
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                'SELECT json, fetched FROM meta WHERE service=? AND type=? AND id=?',
+                (service, item_type, str(item_id))
+            ).fetchone()
+        if row and time.time() - row[1] < METADATA_DB_TTL:
+            return json.loads(row[0])
+    except ValueError as e:
+        # A corrupt entry would fail every lookup, drop it so the item is fetched again
+        logger.warning(f"Discarding unreadable metadata cache entry: {e}")
+        _delete_cached_metadata(service, item_type, item_id)
+    except Exception as e:
+        logger.warning(f"Failed to read metadata cache: {e}")
+    return None
+
+
+def _delete_cached_metadata(service, item_type, item_id):
+    """Remove the stored entry for an item."""
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                'DELETE FROM meta WHERE service=? AND type=? AND id=?',
+                (service, item_type, str(item_id))
+            )
+            connection.commit()
+    except Exception as e:
+        logger.warning(f"Failed to delete metadata cache entry: {e}")
+
+
+def set_cached_metadata(service, item_type, item_id, metadata):
+    """Store metadata for an item, replacing any older entry."""
+    try:
+        data = json.dumps(metadata)
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                'INSERT OR REPLACE INTO meta(service, type, id, json, fetched) VALUES (?, ?, ?, ?, ?)',
+                (service, item_type, str(item_id), data, int(time.time()))
+            )
+            connection.commit()
+    except Exception as e:
+        logger.warning(f"Failed to write metadata cache: {e}")
+
+
+def clear_metadata_cache():
+    """Remove every stored entry."""
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute('DELETE FROM meta')
+            connection.commit()
+    except Exception as e:
+        logger.warning(f"Failed to clear metadata cache: {e}")
@@ -1,5 +1,4 @@
 import re
-import time
 import traceback
 from .accounts import get_account_token
 from .api.apple_music import apple_music_get_album_track_ids, apple_music_get_artist_album_ids, apple_music_get_playlist_data
@@ -12,7 +11,7 @@ from .api.tidal import tidal_get_album_track_ids, tidal_get_artist_album_ids, ti
 from .api.youtube_music import youtube_music_get_channel_track_ids, youtube_music_get_playlist_data
 from .api.generic import generic_get_track_metadata
 from .api.crunchyroll import crunchyroll_get_show_episode_ids
-from .runtimedata import account_pool, get_logger, parsing, download_queue, pending, parsing_lock, pending_lock
+from .runtimedata import account_pool, get_logger, parsing, download_queue, pending, parsing_lock, pending_lock, notify_pending, shutdown_event
 from .utils import format_local_id
 from .otsconfig import config
 
@@ -161,7 +160,7 @@ def parse_url(url):
 
 
 def parsingworker():
-    while True:
+    while not shutdown_event.is_set():
         if parsing:
             try:
                 item_id = next(iter(parsing))
@@ -195,6 +194,7 @@ def parsingworker():
                                         'playlist_by': playlist_by,
                                         'playlist_number': str(index + 1)
                                         }
+                                    notify_pending()
                             except TypeError:
                                 logger.error(f'TypeError for {item}')
                         continue
@@ -214,6 +214,7 @@ def parsingworker():
                                     'playlist_by': 'me',
                                     'playlist_number': str(index + 1)
                                     }
+                                notify_pending()
                         continue
                     elif current_type == "your_episodes":
                         tracks = spotify_get_your_episodes(token)
@@ -232,6 +233,7 @@ def parsingworker():
                                         'playlist_by': 'me',
                                         'playlist_number': str(index + 1)
                                         }
+                                    notify_pending()
                         continue
 
                 if current_service == 'youtube_music' and current_type == 'artist':
@@ -246,6 +248,7 @@ def parsingworker():
                                 'item_id': track_id,
                                 'parent_category': 'album'
                                 }
+                            notify_pending()
                         continue
                     continue
 
@@ -259,6 +262,7 @@ def parsingworker():
                             'item_id': item_id,
                             'parent_category': current_type
                             }
+                        notify_pending()
                     continue
 
                 elif current_type in ["podcast", "audiobook"]:
@@ -273,6 +277,7 @@ def parsingworker():
                                 'item_id': item_id,
                                 'parent_category': current_type
                                 }
+                            notify_pending()
                     continue
 
                 elif current_type in ["album", "playlist", "mix"]:
@@ -300,6 +305,7 @@ def parsingworker():
                                 'playlist_by': playlist_by,
                                 'playlist_number': str(index + 1)
                                 }
+                            notify_pending()
                     continue
 
                 elif current_type in ["artist", "label"]:
@@ -326,9 +332,10 @@ def parsingworker():
                                 'item_id': item_id,
                                 'parent_category': current_type
                                 }
+                            notify_pending()
                     continue
             except Exception as e:
                 logger.error(f"Unknown Exception: {str(e)}\nTraceback: {traceback.format_exc()}")
                 continue
         else:
-            time.sleep(0.2)
+            shutdown_event.wait(0.2)
@@ -1,4 +1,5 @@
 import os
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication, QHBoxLayout, QWidget
 from ..runtimedata import download_queue, get_logger
@@ -7,12 +8,39 @@ from ..utils import open_item
 logger = get_logger("worker.utility")
 
 
+class FileDeleteSignals(QObject):
+    finished = pyqtSignal(object, bool)
+
+
+class FileDeleteTask(QRunnable):
+    def __init__(self, local_id, file_path, signals):
+        super().__init__()
+        self.local_id = local_id
+        self.file_path = file_path
+        self.signals = signals
+
+
+    def run(self):
+        try:
+            os.remove(self.file_path)
+            success = True
+        except OSError as e:
+            logger.error(f"Failed to delete {self.file_path}: {str(e)}")
+            success = False
+        self.signals.finished.emit(self.local_id, success)
+
+
 class DownloadActionsButtons(QWidget):
+    clipboard = None
+    cancelled_text = None
+    # Outlives the rows, a row may be removed while its file is still being deleted
+    file_delete_signals = None
+
     def __init__(self, local_id, item_metadata, pbar, copy_btn, cancel_btn, retry_btn, open_btn, locate_btn, delete_btn, parent=None):
         super(DownloadActionsButtons, self).__init__(parent)
         self.local_id = local_id
         self.item_metadata = item_metadata
-        layout = QHBoxLayout()
+        layout = QHBoxLayout(self)
         layout.setContentsMargins(4, 0, 4, 0)  # No vertical margins - let row height control
         layout.setSpacing(4)
         layout.addWidget(pbar, 1)  # stretch=1 so progress bar takes available space
@@ -38,33 +66,65 @@ class DownloadActionsButtons(QWidget):
             self.delete_btn = delete_btn
             delete_btn.clicked.connect(self.delete_file)
             layout.addWidget(delete_btn)
-        self.setLayout(layout)
+            if DownloadActionsButtons.file_delete_signals is None:
+                DownloadActionsButtons.file_delete_signals = FileDeleteSignals()
+                DownloadActionsButtons.file_delete_signals.finished.connect(DownloadActionsButtons.file_deleted)
+        if DownloadActionsButtons.cancelled_text is None:
+            DownloadActionsButtons.retranslate_status_text()
+
+
+    @classmethod
+    def retranslate_status_text(cls):
+        # Status text is fixed per language, translate once for every row instead of on every click
+        cls.cancelled_text = QCoreApplication.translate("DownloadActionsButtons", "Cancelled")
+        cls.waiting_text = QCoreApplication.translate("DownloadActionsButtons", "Waiting")
+        cls.deleted_text = QCoreApplication.translate("DownloadActionsButtons", "Deleted")
+        cls.deleting_text = QCoreApplication.translate("DownloadActionsButtons", "Deleting...")
+
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.Type.LanguageChange:
+            self.retranslate_status_text()
+        super().changeEvent(event)
+
+
+    def swap_buttons(self, hide, show):
+        # Suspend painting so the row is relaid out once for the whole change
+        self.setUpdatesEnabled(False)
+        try:
+            for btn in hide:
+                btn.hide()
+            for btn in show:
+                btn.show()
+        finally:
+            self.setUpdatesEnabled(True)
 
 
     def copy_link(self):
-        QApplication.clipboard().setText(self.item_metadata['item_url'])
+        # The application clipboard lives as long as the app, resolve it once for every row
+        if DownloadActionsButtons.clipboard is None:
+            DownloadActionsButtons.clipboard = QApplication.clipboard()
+        DownloadActionsButtons.clipboard.setText(self.item_metadata['item_url'])
 
 
     def cancel_item(self):
-        download_queue[self.local_id]['item_status'] = "Cancelled"
-        download_queue[self.local_id]['gui']['status_label'].setText(self.tr("Cancelled"))
-        download_queue[self.local_id]['gui']['progress_bar'].setValue(0)
-        self.cancel_btn.hide()
-        self.retry_btn.show()
+        item = download_queue[self.local_id]
+        item['item_status'] = "Cancelled"
+        item['gui']['status_label'].setText(self.cancelled_text)
+        item['gui']['progress_bar'].setValue(0)
+        self.swap_buttons((self.cancel_btn,), (self.retry_btn,))
 
 
     def retry_item(self):
-        download_queue[self.local_id]['item_status'] = "Waiting"
-        download_queue[self.local_id]['gui']['status_label'].setText(self.tr("Waiting"))
-        download_queue[self.local_id]['gui']['progress_bar'].setValue(0)
-        self.retry_btn.hide()
-        self.cancel_btn.show()
+        item = download_queue[self.local_id]
+        item['item_status'] = "Waiting"
+        item['gui']['status_label'].setText(self.waiting_text)
+        item['gui']['progress_bar'].setValue(0)
+        self.swap_buttons((self.retry_btn,), (self.cancel_btn,))
 
 
     def open_file(self):
-        file_path = download_queue[self.local_id]['file_path']
-        file = os.path.abspath(file_path)
-        open_item(file)
+        open_item(download_queue[self.local_id]['file_path'])
 
 
     def locate_file(self):
@@ -74,12 +134,32 @@ class DownloadActionsButtons(QWidget):
 
 
     def delete_file(self):
-        file_path = download_queue[self.local_id]['file_path']
-        file = os.path.abspath(file_path)
-        os.remove(file)
-        download_queue[self.local_id]["item_status"] = 'Deleted'
-        download_queue[self.local_id]["gui"]["status_label"].setText(self.tr("Deleted"))
-        self.open_btn.hide()
-        self.locate_btn.hide()
-        self.delete_btn.hide()
-        self.retry_btn.show()
+        # Removing a large file on a slow or network drive can take a while, keep it off the ui thread
+        item = download_queue[self.local_id]
+        self.previous_status_text = item["gui"]["status_label"].text()
+        item["gui"]["status_label"].setText(self.deleting_text)
+        self.delete_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(FileDeleteTask(self.local_id, item['file_path'], self.file_delete_signals))
+
+
+    @staticmethod
+    def file_deleted(local_id, success):
+        item = download_queue.get(local_id)
+        if item is None:
+            return
+        try:
+            item['gui']['btn']['actions'].file_delete_finished(success)
+        except RuntimeError:
+            # The row was removed while the file was being deleted
+            pass
+
+
+    def file_delete_finished(self, success):
+        item = download_queue[self.local_id]
+        self.delete_btn.setEnabled(True)
+        if not success:
+            item["gui"]["status_label"].setText(self.previous_status_text)
+            return
+        item["item_status"] = 'Deleted'
+        item["gui"]["status_label"].setText(self.deleted_text)
+        self.swap_buttons((self.open_btn, self.locate_btn, self.delete_btn), (self.retry_btn,))
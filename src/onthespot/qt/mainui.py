@@ -3,9 +3,10 @@ import shutil
 import threading
 import time
 import traceback
+from collections import Counter, OrderedDict
 from urllib3.exceptions import MaxRetryError, NewConnectionError
 from PyQt6 import uic, QtGui
-from PyQt6.QtCore import QThread, QDir, Qt, pyqtSignal, QObject, QTimer
+from PyQt6.QtCore import QThread, QThreadPool, QRunnable, QDir, Qt, pyqtSignal, QObject, QTimer
 from PyQt6.QtGui import QIcon, QColor, QShortcut, QKeySequence
 from PyQt6.QtWidgets import QApplication, QMainWindow, QHeaderView, QLabel, QPushButton, QProgressBar, QTableWidgetItem, QFileDialog, QRadioButton, QHBoxLayout, QWidget, QColorDialog, QStatusBar
 from ..accounts import get_account_token, FillAccountPool
@@ -21,62 +22,183 @@ from ..api.generic import generic_add_account, generic_get_track_metadata, gener
 from ..api.crunchyroll import crunchyroll_add_account, crunchyroll_get_episode_metadata
 from ..downloader import DownloadWorker, RetryWorker
 from ..otsconfig import config, cache_dir
-from ..runtimedata import account_pool, download_queue, download_queue_lock, get_init_tray, parsing, parsing_lock, pending, pending_lock, get_logger, temp_download_path
+from ..runtimedata import account_pool, download_queue, download_queue_lock, get_init_tray, parsing, parsing_lock, pending, pending_lock, get_logger, temp_download_path, get_ready_pending_id, retry_pending_item, pending_signals
 from .dl_progressbtn import DownloadActionsButtons
 from .settings import load_config, save_config
 from .thumb_listitem import LabelWithThumb
 from ..utils import is_latest_release, open_item, format_bytes
 from ..search import get_search_results
-from ..ui_theme import get_complete_theme, get_status_style, get_progress_bar_style, get_button_style, format_duration, COLORS, set_accent_color, get_colors
+from ..ui_theme import get_complete_theme, get_status_style, get_progress_bar_style, get_button_style, get_item_label_style, get_status_bar_label_style, format_duration, set_accent_color, get_colors
 from ..stealth import get_stealth_stats
+from ..metadata_cache import get_cached_metadata, set_cached_metadata, clear_metadata_cache
 
 logger = get_logger('gui.main_ui')
 
+METADATA_FETCHERS = {
+    ('apple_music', 'track'): apple_music_get_track_metadata,
+    ('bandcamp', 'track'): bandcamp_get_track_metadata,
+    ('deezer', 'track'): deezer_get_track_metadata,
+    ('qobuz', 'track'): qobuz_get_track_metadata,
+    ('soundcloud', 'track'): soundcloud_get_track_metadata,
+    ('spotify', 'track'): spotify_get_track_metadata,
+    ('spotify', 'podcast_episode'): spotify_get_podcast_episode_metadata,
+    ('tidal', 'track'): tidal_get_track_metadata,
+    ('youtube_music', 'track'): youtube_music_get_track_metadata,
+    ('generic', 'track'): generic_get_track_metadata,
+    ('crunchyroll', 'episode'): crunchyroll_get_episode_metadata,
+}
+
+DOWNLOAD_UPDATE_INTERVAL = 100  # ms, progress is not readable any faster than ~10 updates a second
+METADATA_CACHE_SIZE = 4096
+METADATA_CACHE_TTL = 3600  # seconds
+# Rows in these states are dropped by "Clear Completed"
+COMPLETED_STATUSES = frozenset(("Cancelled", "Deleted", "Downloaded", "Already Exists"))
+metadata_cache = OrderedDict()
+metadata_cache_lock = threading.Lock()
+
+
+def get_item_metadata(item):
+    """Fetch item metadata, reusing it when the same item is queued again."""
+    cache_key = (item['item_service'], item['item_type'], item['item_id'])
+    with metadata_cache_lock:
+        cached = metadata_cache.get(cache_key)
+        if cached:
+            metadata_cache.move_to_end(cache_key)
+    if cached and time.time() - cached[0] < METADATA_CACHE_TTL:
+        # Hand out a copy, the download list and workers add their own keys
+        return dict(cached[1])
+
+    # Fall back to the on-disk cache so a restarted queue does not refetch everything
+    item_metadata = get_cached_metadata(*cache_key)
+    if not item_metadata:
+        token = get_account_token(item['item_service'])
+        item_metadata = METADATA_FETCHERS[(item['item_service'], item['item_type'])](token, item['item_id'])
+        if not item_metadata:
+            return item_metadata
+        set_cached_metadata(*cache_key, item_metadata)
+
+    with metadata_cache_lock:
+        metadata_cache[cache_key] = (time.time(), item_metadata)
+        metadata_cache.move_to_end(cache_key)
+        if len(metadata_cache) > METADATA_CACHE_SIZE:
+            metadata_cache.popitem(last=False)
+    return dict(item_metadata)
+
+
+def set_text_if_changed(widget, text):
+    # Setting identical text or stylesheets still invalidates layout and forces a restyle
+    if widget.text() != text:
+        widget.setText(text)
+        return True
+    return False
+
+
+def set_style_if_changed(widget, style):
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
 
-class QueueWorker(QObject):
+def get_queue_status_group(status):
+    status = status.lower()
+    if status in ('downloading', 'converting', 'getting info'):
+        return 'downloading'
+    elif status in ('downloaded', 'already exists') or 'done' in status:
+        return 'completed'
+    elif status == 'waiting':
+        return 'waiting'
+    elif 'wait' in status:  # Stealth waiting (e.g., "Done · Wait 1m 30s")
+        return 'stealth_waiting'
+    elif status == 'failed' or 'fail' in status:
+        return 'failed'
+    return 'other'
+
+
+class QueueWorkerSignals(QObject):
     add_item_to_download_list = pyqtSignal(dict, dict)
+    finished = pyqtSignal()
 
-    def __init__(self):
+
+class MetadataFetchTask(QRunnable):
+    def __init__(self, item, signals):
         super().__init__()
-        self.is_running = True
-        self.thread = threading.Thread(target=self.run)
+        self.item = item
+        self.signals = signals
+
+
+    def run(self):
+        item = self.item
+        try:
+            item_metadata = get_item_metadata(item)
+            if item_metadata:
+                self.signals.add_item_to_download_list.emit(item, item_metadata)
+        except Exception as e:
+            logger.error(f"Unknown Exception for {item}: {str(e)}\nTraceback: {traceback.format_exc()}")
+            retry_pending_item(item)
+        finally:
+            self.signals.finished.emit()
 
 
-    def start(self):
-        self.thread.start()
+class FileTaskSignals(QObject):
+    finished = pyqtSignal(str)
+
+
+class FileTask(QRunnable):
+    def __init__(self, func, message, signals):
+        super().__init__()
+        self.func = func
+        self.message = message
+        self.signals = signals
 
 
     def run(self):
-        while self.is_running:
-            if pending:
-                try:
-                    local_id = next(iter(pending))
-                    with pending_lock:
-                        item = pending.pop(local_id)
-                    token = get_account_token(item['item_service'])
-                    item_metadata = globals()[f"{item['item_service']}_get_{item['item_type']}_metadata"](token, item['item_id'])
-                    if item_metadata:
-                        self.add_item_to_download_list.emit(item, item_metadata)
-                        # Padding for 'GLib-ERROR : Creating pipes for GWakeup: Too many open files Trace/breakpoint trap'
-                        # when mass downloading cached responses with download queue thumbnails enabled.
-                        if config.get('show_download_thumbnails'):
-                            time.sleep(0.1)
-                    continue
-                except Exception as e:
-                    logger.error(f"Unknown Exception for {item}: {str(e)}\nTraceback: {traceback.format_exc()}")
-                    with pending_lock:
-                        pending[local_id] = item
-            else:
-                time.sleep(0.2)
+        try:
+            self.func()
+            self.signals.finished.emit(self.message)
+        except Exception as e:
+            logger.error(f"File task failed: {str(e)}\nTraceback: {traceback.format_exc()}")
+            self.signals.finished.emit(str(e))
+
+
+class LoginTask(QRunnable):
+    def __init__(self, signal, func, *args):
+        super().__init__()
+        self.signal = signal
+        self.func = func
+        self.args = args
+
+
+    def run(self):
+        # An exception escaping QRunnable.run aborts the whole application
+        try:
+            added = bool(self.func(*self.args))
+        except Exception as e:
+            logger.error(f"Account login failed: {str(e)}\nTraceback: {traceback.format_exc()}")
+            added = False
+        self.signal.emit(added)
+
+
+class SearchWorker(QThread):
+    results_ready = pyqtSignal(object)
+
+    def __init__(self, search_term, content_types):
+        super().__init__()
+        self.search_term = search_term
+        self.content_types = content_types
 
 
-    def stop(self):
-        logger.info('Stopping Queue Worker')
-        self.is_running = False
-        self.thread.join()
+    def run(self):
+        try:
+            results = get_search_results(self.search_term, self.content_types)
+        except Exception as e:
+            logger.error(f"Search failed for '{self.search_term}': {str(e)}\nTraceback: {traceback.format_exc()}")
+            results = False
+        self.results_ready.emit(results)
 
 
 class MainWindow(QMainWindow):
+    # Login workers run on the thread pool, widgets are only touched once this reaches the GUI thread
+    account_added = pyqtSignal(bool)
+
     def closeEvent(self, event):
         if config.get('close_to_tray') and get_init_tray():
             event.ignore()
@@ -91,6 +213,17 @@ class MainWindow(QMainWindow):
         uic.loadUi(os.path.join(self.path, "qtui", "main.ui"), self)
         self.setWindowIcon(self.get_icon('onthespot'))
 
+        # Icons and tooltips shared by every download row, resolved once instead of per row
+        self.download_row_icons = {name: self.get_icon(name) for name in ('link', 'stop', 'retry', 'file', 'folder', 'trash')}
+        self.download_row_tooltips = {
+            'copy': self.tr('Copy'),
+            'cancel': self.tr('Cancel'),
+            'retry': self.tr('Retry'),
+            'open': self.tr('Open'),
+            'locate': self.tr('Locate'),
+            'delete': self.tr('Delete'),
+        }
+
         # Load saved accent color if available
         saved_accent = config.get('accent_color')
         if saved_accent:
@@ -100,6 +233,22 @@ class MainWindow(QMainWindow):
         self.apply_modern_theme()
 
         self.start_url = start_url
+        self.search_worker = None
+        self.account_added.connect(self.account_add_finished)
+        # Logins wait on the user for as long as they take, keep them off the global pool used by file tasks
+        self.login_pool = QThreadPool(self)
+        # Local id of each download table row, kept in step with row inserts and removals
+        self.download_row_ids = []
+        self.last_hidden_statuses = set()
+
+        # Download progress arrives per chunk, keep the latest state per row and apply it in batches
+        self.pending_download_items = []
+        self.pending_download_updates = {}
+        self.download_list_status_changed = False
+        self.download_update_timer = QTimer(self)
+        self.download_update_timer.setSingleShot(True)
+        self.download_update_timer.setInterval(DOWNLOAD_UPDATE_INTERVAL)
+        self.download_update_timer.timeout.connect(self.flush_download_list_updates)
         logger.info(f"Initialising main window, logging session : {config.session_uuid}")
 
         # Fill the value from configs
@@ -117,10 +266,25 @@ class MainWindow(QMainWindow):
         fillaccountpool.progress.connect(self.show_popup_dialog)
         fillaccountpool.start()
 
-        for i in range(config.get('maximum_queue_workers')):
-            queueworker = QueueWorker()
-            queueworker.add_item_to_download_list.connect(self.add_item_to_download_list)
-            queueworker.start()
+        # Metadata for pending items is fetched on a thread pool. Items are handed out when one
+        # is added to pending or a fetch finishes, and only as many as there are idle threads,
+        # so nothing polls while the queue is empty
+        self.queue_pool = QThreadPool(self)
+        self.queue_pool.setMaxThreadCount(config.get('maximum_queue_workers'))
+        self.queue_tasks_running = 0
+        self.queue_signals = QueueWorkerSignals()
+        self.queue_signals.add_item_to_download_list.connect(self.queue_item_for_download_list)
+        self.queue_signals.finished.connect(self.pending_item_fetched)
+        self.queue_timer = QTimer(self)
+        self.queue_timer.setSingleShot(True)
+        self.queue_timer.timeout.connect(self.dispatch_pending_items)
+        # Queued, the signal may be emitted on this thread while pending_lock is held
+        pending_signals.item_added.connect(self.schedule_pending_dispatch, Qt.ConnectionType.QueuedConnection)
+        self.schedule_pending_dispatch()
+
+        # Cache clearing and log export can take a while on large caches, keep them off the UI thread
+        self.file_task_signals = FileTaskSignals()
+        self.file_task_signals.finished.connect(self.show_popup_dialog)
 
         for i in range(config.get('maximum_download_workers')):
             downloadworker = DownloadWorker(gui=True)
@@ -162,6 +326,7 @@ class MainWindow(QMainWindow):
         self.apply_modern_theme()
 
         # Refresh all download table items
+        btn_style = get_button_style()
         with download_queue_lock:
             for local_id, item in download_queue.items():
                 if 'gui' in item:
@@ -181,7 +346,6 @@ class MainWindow(QMainWindow):
                             item['gui']['progress_bar'].setStyleSheet(get_progress_bar_style())
 
                     # Refresh button styles
-                    btn_style = get_button_style()
                     if 'btn' in item['gui']:
                         for btn_name, btn in item['gui']['btn'].items():
                             if btn and btn_name != 'actions':
@@ -197,13 +361,13 @@ class MainWindow(QMainWindow):
 
         # Create status labels
         self.stealth_status_label = QLabel("🛡️ Stealth: --/-- hr, --/-- day")
-        self.stealth_status_label.setStyleSheet(f"color: {COLORS['text_secondary']}; padding: 0 15px;")
+        self.stealth_status_label.setStyleSheet(get_status_bar_label_style())
 
         self.speed_status_label = QLabel("⬇️ -- KB/s")
-        self.speed_status_label.setStyleSheet(f"color: {COLORS['text_secondary']}; padding: 0 15px;")
+        self.speed_status_label.setStyleSheet(get_status_bar_label_style())
 
         self.queue_status_label = QLabel("📥 0 downloading, 0 completed, 0 waiting")
-        self.queue_status_label.setStyleSheet(f"color: {COLORS['text_secondary']}; padding: 0 15px;")
+        self.queue_status_label.setStyleSheet(get_status_bar_label_style())
 
         # Add to status bar
         self.status_bar.addWidget(self.stealth_status_label)
@@ -231,32 +395,24 @@ class MainWindow(QMainWindow):
                 stats = get_stealth_stats()
                 max_hr = config.get('stealth_max_tracks_per_hour', 20)
                 max_day = config.get('stealth_max_tracks_per_day', 100)
-                self.stealth_status_label.setText(
+                set_text_if_changed(
+                    self.stealth_status_label,
                     f"🛡️ Stealth: {stats['tracks_this_hour']}/{max_hr} hr, {stats['tracks_today']}/{max_day} day"
                 )
             else:
-                self.stealth_status_label.setText("🛡️ Stealth: OFF")
-
-            # Update queue stats
-            downloading = 0
-            completed = 0
-            waiting = 0
-            failed = 0
-            stealth_waiting = 0
+                set_text_if_changed(self.stealth_status_label, "🛡️ Stealth: OFF")
 
+            # Update queue stats, only a handful of distinct statuses need classifying
             with download_queue_lock:
-                for item in download_queue.values():
-                    status = item.get('item_status', '').lower()
-                    if status in ('downloading', 'converting', 'getting info'):
-                        downloading += 1
-                    elif status in ('downloaded', 'already exists') or 'done' in status:
-                        completed += 1
-                    elif status == 'waiting':
-                        waiting += 1
-                    elif 'wait' in status:  # Stealth waiting (e.g., "Done · Wait 1m 30s")
-                        stealth_waiting += 1
-                    elif status == 'failed' or 'fail' in status:
-                        failed += 1
+                status_counts = Counter(item.get('item_status', '') for item in download_queue.values())
+            queue_counts = Counter()
+            for status, count in status_counts.items():
+                queue_counts[get_queue_status_group(status)] += count
+            downloading = queue_counts['downloading']
+            completed = queue_counts['completed']
+            waiting = queue_counts['waiting']
+            failed = queue_counts['failed']
+            stealth_waiting = queue_counts['stealth_waiting']
 
             # Include stealth waiting in queue display
             queue_text = f"📥 {downloading} active, {completed} done"
@@ -267,13 +423,13 @@ class MainWindow(QMainWindow):
             if failed > 0:
                 queue_text += f", {failed} failed"
 
-            self.queue_status_label.setText(queue_text)
+            set_text_if_changed(self.queue_status_label, queue_text)
 
             # Update download speed (placeholder - actual implementation needs speed tracking)
             if downloading > 0:
-                self.speed_status_label.setText(f"⬇️ {downloading} downloading...")
+                set_text_if_changed(self.speed_status_label, f"⬇️ {downloading} downloading...")
             else:
-                self.speed_status_label.setText("⬇️ Idle")
+                set_text_if_changed(self.speed_status_label, "⬇️ Idle")
 
         except Exception as e:
             logger.debug(f"Status bar update error: {e}")
@@ -336,12 +492,6 @@ class MainWindow(QMainWindow):
         self.download_queue_show_cancelled.stateChanged.connect(self.update_table_visibility)
         self.download_queue_show_completed.stateChanged.connect(self.update_table_visibility)
 
-        self.download_queue_show_waiting.stateChanged.connect(self.update_table_visibility)
-        self.download_queue_show_failed.stateChanged.connect(self.update_table_visibility)
-        self.download_queue_show_cancelled.stateChanged.connect(self.update_table_visibility)
-        self.download_queue_show_unavailable.stateChanged.connect(self.update_table_visibility)
-        self.download_queue_show_completed.stateChanged.connect(self.update_table_visibility)
-
         self.mirror_spotify_playback.stateChanged.connect(self.manage_mirror_spotify_playback)
 
         self.settings_bookmark_accounts.clicked.connect(lambda: self.settings_scroll_area.verticalScrollBar().setValue(0))
@@ -351,20 +501,8 @@ class MainWindow(QMainWindow):
         self.settings_bookmark_video_downloads.clicked.connect(lambda: self.settings_scroll_area.verticalScrollBar().setValue(9999))
 
 
-        self.clear_cache.clicked.connect(lambda: (
-            shutil.rmtree(os.path.join(cache_dir(), "reqcache"), ignore_errors=True),
-            shutil.rmtree(os.path.join(cache_dir(), "logs"), ignore_errors=True),
-            self.show_popup_dialog(self.tr("Cache Cleared"))
-        ))
-        self.export_logs.clicked.connect(lambda: (
-            shutil.copy(
-                os.path.join(cache_dir(), "logs", config.session_uuid, "onthespot.log"),
-                os.path.join(os.path.expanduser("~"), "Downloads", "onthespot.log")
-            ),
-            self.show_popup_dialog(self.tr("Logs exported to '{0}'").format(
-                os.path.join(os.path.expanduser("~"), "Downloads", "onthespot.log")
-            ))
-        ))
+        self.clear_cache.clicked.connect(self.clear_cache_files)
+        self.export_logs.clicked.connect(self.export_log_file)
         self.donate.clicked.connect(lambda: open_item('https://justin025.github.io/about.html'))
 
 
@@ -417,6 +555,31 @@ class MainWindow(QMainWindow):
         if new_path:
             temp_download_path.append(new_path)
 
+    def clear_cache_files(self):
+        with metadata_cache_lock:
+            metadata_cache.clear()
+
+        def clear():
+            shutil.rmtree(os.path.join(cache_dir(), "reqcache"), ignore_errors=True)
+            shutil.rmtree(os.path.join(cache_dir(), "logs"), ignore_errors=True)
+            clear_metadata_cache()
+
+        self.show_popup_dialog(self.tr("Clearing cache..."), btn_hide=True)
+        QThreadPool.globalInstance().start(FileTask(clear, self.tr("Cache Cleared"), self.file_task_signals))
+
+
+    def export_log_file(self):
+        export_path = os.path.join(os.path.expanduser("~"), "Downloads", "onthespot.log")
+
+        def export():
+            shutil.copy(os.path.join(cache_dir(), "logs", config.session_uuid, "onthespot.log"), export_path)
+
+        self.show_popup_dialog(self.tr("Exporting logs..."), btn_hide=True)
+        QThreadPool.globalInstance().start(
+            FileTask(export, self.tr("Logs exported to '{0}'").format(export_path), self.file_task_signals)
+        )
+
+
     def show_popup_dialog(self, txt, btn_hide=False, download=False):
         if download and config.get('disable_download_popups'):
             return
@@ -446,9 +609,9 @@ class MainWindow(QMainWindow):
 
 
     def fill_account_table(self):
+        self.tbl_sessions.setUpdatesEnabled(False)
         # Clear the table
-        while self.tbl_sessions.rowCount() > 0:
-            self.tbl_sessions.removeRow(0)
+        self.tbl_sessions.setRowCount(0)
 
         # Create a button group for exclusive radio button selection
         if not hasattr(self, 'account_radio_group'):
@@ -460,19 +623,16 @@ class MainWindow(QMainWindow):
             for btn in self.account_radio_group.buttons():
                 self.account_radio_group.removeButton(btn)
 
-        sn = 0
-        for account in account_pool:
-            sn = sn + 1
-            rows = self.tbl_sessions.rowCount()
-
+        active_account_number = config.get("active_account_number")
+        self.tbl_sessions.setRowCount(len(account_pool))
+        for row, account in enumerate(account_pool):
             radiobutton = QRadioButton()
-            row_index = rows  # Capture the current row index
-            radiobutton.clicked.connect(lambda checked, r=row_index: self.select_active_account(r))
-            if sn == config.get("active_account_number") + 1:
+            radiobutton.clicked.connect(lambda checked, r=row: self.select_active_account(r))
+            if row == active_account_number:
                 radiobutton.setChecked(True)
 
             # Add to button group for exclusive selection
-            self.account_radio_group.addButton(radiobutton, rows)
+            self.account_radio_group.addButton(radiobutton, row)
 
             remove_btn = QPushButton(self.tbl_sessions)
             remove_btn.setIcon(self.get_icon('trash'))
@@ -484,14 +644,14 @@ class MainWindow(QMainWindow):
             service = QTableWidgetItem(str(account["service"]).replace('_', ' ').title())
             service.setIcon(self.get_icon(account["service"]))
 
-            self.tbl_sessions.insertRow(rows)
-            self.tbl_sessions.setCellWidget(rows, 0, radiobutton)
-            self.tbl_sessions.setItem(rows, 1, QTableWidgetItem(account["username"][:22]))
-            self.tbl_sessions.setItem(rows, 2, QTableWidgetItem(service))
-            self.tbl_sessions.setItem(rows, 3, QTableWidgetItem(str(account["account_type"]).title()))
-            self.tbl_sessions.setItem(rows, 4, QTableWidgetItem(account["bitrate"]))
-            self.tbl_sessions.setItem(rows, 5, QTableWidgetItem(status))
-            self.tbl_sessions.setCellWidget(rows, 6, remove_btn)
+            self.tbl_sessions.setCellWidget(row, 0, radiobutton)
+            self.tbl_sessions.setItem(row, 1, QTableWidgetItem(account["username"][:22]))
+            self.tbl_sessions.setItem(row, 2, QTableWidgetItem(service))
+            self.tbl_sessions.setItem(row, 3, QTableWidgetItem(str(account["account_type"]).title()))
+            self.tbl_sessions.setItem(row, 4, QTableWidgetItem(account["bitrate"]))
+            self.tbl_sessions.setItem(row, 5, QTableWidgetItem(status))
+            self.tbl_sessions.setCellWidget(row, 6, remove_btn)
+        self.tbl_sessions.setUpdatesEnabled(True)
         logger.info("Accounts table was populated !")
 
     def select_active_account(self, row):
@@ -515,47 +675,49 @@ class MainWindow(QMainWindow):
 
         # Button styling - 26px height fits in 30px row
         btn_style = get_button_style()
+        icons = self.download_row_icons
+        tooltips = self.download_row_tooltips
 
         if config.get("download_copy_btn"):
             copy_btn = QPushButton()
-            copy_btn.setIcon(self.get_icon('link'))
-            copy_btn.setToolTip(self.tr('Copy'))
+            copy_btn.setIcon(icons['link'])
+            copy_btn.setToolTip(tooltips['copy'])
             copy_btn.setFixedSize(26, 20)
             copy_btn.setStyleSheet(btn_style)
             copy_btn.hide()
         cancel_btn = QPushButton()
-        cancel_btn.setIcon(self.get_icon('stop'))
-        cancel_btn.setToolTip(self.tr('Cancel'))
+        cancel_btn.setIcon(icons['stop'])
+        cancel_btn.setToolTip(tooltips['cancel'])
         cancel_btn.setFixedSize(26, 20)
         cancel_btn.setStyleSheet(btn_style)
         cancel_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         retry_btn = QPushButton()
-        retry_btn.setIcon(self.get_icon('retry'))
-        retry_btn.setToolTip(self.tr('Retry'))
+        retry_btn.setIcon(icons['retry'])
+        retry_btn.setToolTip(tooltips['retry'])
         retry_btn.setFixedSize(26, 20)
         retry_btn.setStyleSheet(btn_style)
         retry_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         retry_btn.hide()
         if config.get("download_open_btn"):
             open_btn = QPushButton()
-            open_btn.setIcon(self.get_icon('file'))
-            open_btn.setToolTip(self.tr('Open'))
+            open_btn.setIcon(icons['file'])
+            open_btn.setToolTip(tooltips['open'])
             open_btn.setFixedSize(26, 20)
             open_btn.setStyleSheet(btn_style)
             open_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
             open_btn.hide()
         if config.get("download_locate_btn"):
             locate_btn = QPushButton()
-            locate_btn.setIcon(self.get_icon('folder'))
-            locate_btn.setToolTip(self.tr('Locate'))
+            locate_btn.setIcon(icons['folder'])
+            locate_btn.setToolTip(tooltips['locate'])
             locate_btn.setFixedSize(26, 20)
             locate_btn.setStyleSheet(btn_style)
             locate_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
             locate_btn.hide()
         if config.get("download_delete_btn"):
             delete_btn = QPushButton()
-            delete_btn.setIcon(self.get_icon('trash'))
-            delete_btn.setToolTip(self.tr('Delete'))
+            delete_btn.setIcon(icons['trash'])
+            delete_btn.setToolTip(tooltips['delete'])
             delete_btn.setFixedSize(26, 20)
             delete_btn.setStyleSheet(btn_style)
             delete_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -592,6 +754,7 @@ class MainWindow(QMainWindow):
 
         rows = self.tbl_dl_progress.rowCount()
         self.tbl_dl_progress.insertRow(rows)
+        self.download_row_ids.append(item['local_id'])
         if item_metadata.get('explicit'):
             title = config.get('explicit_label') + ' ' + item_metadata.get('title')
         else:
@@ -600,18 +763,20 @@ class MainWindow(QMainWindow):
         # Add duration to title display
         title_with_duration = f"{title}  ⏱️ {song_duration}" if song_duration != "--:--" else title
 
+        # Add To List
+        self.tbl_dl_progress.setItem(rows, 0, QTableWidgetItem(str(item['local_id'])))
         if config.get('show_download_thumbnails') and item_metadata.get('image_url'):
             self.tbl_dl_progress.setRowHeight(rows, config.get("thumbnail_size"))
             item_label = LabelWithThumb(title_with_duration, item_metadata.get('image_url'))
+            item_label.setStyleSheet(get_item_label_style())
+            self.tbl_dl_progress.setCellWidget(rows, 1, item_label)
         else:
-            item_label = QLabel(self.tbl_dl_progress)
-            item_label.setText(title_with_duration)
-            item_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        item_label.setStyleSheet(f"background-color: transparent; color: {COLORS['text_primary']}; padding-left: 8px;")
-
-        # Add To List
-        self.tbl_dl_progress.setItem(rows, 0, QTableWidgetItem(str(item['local_id'])))
-        self.tbl_dl_progress.setCellWidget(rows, 1, item_label)
+            # Plain text does not need a widget per row, an item is far cheaper to create and paint.
+            # The theme's item padding gives it the same indent as the label.
+            item_label = QTableWidgetItem(title_with_duration)
+            item_label.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+            item_label.setForeground(QColor(get_colors()['text_primary']))
+            self.tbl_dl_progress.setItem(rows, 1, item_label)
         self.tbl_dl_progress.setItem(rows, 2, QTableWidgetItem(item_by))
         self.tbl_dl_progress.setItem(rows, 3, QTableWidgetItem(item_category))
         self.tbl_dl_progress.setItem(rows, 4, service_label)
@@ -619,7 +784,7 @@ class MainWindow(QMainWindow):
         self.tbl_dl_progress.setCellWidget(rows, 6, actions)
 
         # Hide if filter is applied
-        self.update_table_visibility()
+        self.tbl_dl_progress.setRowHidden(rows, status_label.text() in self.get_hidden_statuses())
 
         with download_queue_lock:
             download_queue[item['local_id']] = {
@@ -651,30 +816,98 @@ class MainWindow(QMainWindow):
                 }
 
 
+    def schedule_pending_dispatch(self, delay=0):
+        # A burst of added items collapses into one dispatch, a later retry deadline never
+        # postpones an earlier one
+        if not self.queue_timer.isActive() or self.queue_timer.remainingTime() > delay:
+            self.queue_timer.start(delay)
+
+
+    def pending_item_fetched(self):
+        self.queue_tasks_running -= 1
+        self.schedule_pending_dispatch()
+
+
+    def dispatch_pending_items(self):
+        # Counted here rather than with activeThreadCount, which still includes a task
+        # that has emitted finished but not yet returned
+        idle_threads = self.queue_pool.maxThreadCount() - self.queue_tasks_running
+        next_retry_at = None
+        with pending_lock:
+            while idle_threads > 0:
+                local_id = get_ready_pending_id()
+                if local_id is None:
+                    break
+                item = pending.pop(local_id)
+                self.queue_pool.start(MetadataFetchTask(item, self.queue_signals))
+                self.queue_tasks_running += 1
+                idle_threads -= 1
+            if idle_threads > 0 and pending:
+                next_retry_at = min(item.get('_retry_at', 0) for item in pending.values())
+        if next_retry_at is not None:
+            # Only items still backing off are left, come back when the first one is due
+            self.schedule_pending_dispatch(max(0, int((next_retry_at - time.time()) * 1000)))
+
+
+    def queue_item_for_download_list(self, item, item_metadata):
+        # Rows for a whole playlist arrive in a burst, insert them together on the next flush
+        self.pending_download_items.append((item, item_metadata))
+        if not self.download_update_timer.isActive():
+            self.download_update_timer.start()
+
+
     def update_item_in_download_list(self, item, status, progress):
+        self.pending_download_updates[item['local_id']] = (item, status, progress)
+        if not self.download_update_timer.isActive():
+            self.download_update_timer.start()
+
+
+    def flush_download_list_updates(self):
+        new_items = self.pending_download_items
+        self.pending_download_items = []
+        updates = self.pending_download_updates
+        self.pending_download_updates = {}
         self.statistics.setText(self.tr("{0} / {1}").format(config.get('total_downloaded_items'), format_bytes(config.get('total_downloaded_data'))))
+        self.tbl_dl_progress.setUpdatesEnabled(False)
+        try:
+            # Row visibility only depends on status text, progress alone never moves a row in or out of a filter
+            self.download_list_status_changed = False
+            for item, item_metadata in new_items:
+                try:
+                    self.add_item_to_download_list(item, item_metadata)
+                except Exception as e:
+                    logger.error(f"Failed to add {item} to download list: {str(e)}\nTraceback: {traceback.format_exc()}")
+            for item, status, progress in updates.values():
+                self.apply_download_list_update(item, status, progress)
+            if self.download_list_status_changed:
+                self.update_table_visibility()
+        finally:
+            self.tbl_dl_progress.setUpdatesEnabled(True)
+
+
+    def apply_download_list_update(self, item, status, progress):
         with download_queue_lock:
             # Check if GUI widgets still exist before updating
             if 'gui' not in item or 'status_label' not in item['gui']:
                 return
             try:
                 # Update status with colored badge
-                item['gui']['status_label'].setText(status)
-                item['gui']['status_label'].setStyleSheet(get_status_style(status))
+                if set_text_if_changed(item['gui']['status_label'], status):
+                    self.download_list_status_changed = True
+                set_style_if_changed(item['gui']['status_label'], get_status_style(status))
             except RuntimeError:
                 # Widget was deleted (row cleared from table)
                 return
 
             # Update progress bar with appropriate style
             if progress == 100:
-                item['gui']['progress_bar'].setStyleSheet(get_progress_bar_style('completed'))
+                set_style_if_changed(item['gui']['progress_bar'], get_progress_bar_style('completed'))
             elif 'fail' in status.lower():
-                item['gui']['progress_bar'].setStyleSheet(get_progress_bar_style('failed'))
+                set_style_if_changed(item['gui']['progress_bar'], get_progress_bar_style('failed'))
             else:
-                item['gui']['progress_bar'].setStyleSheet(get_progress_bar_style())
+                set_style_if_changed(item['gui']['progress_bar'], get_progress_bar_style())
 
             item['gui']['progress_bar'].setValue(progress)
-            self.update_table_visibility()
 
             if item['item_status'] == 'Unavailable':
                 item['gui']["btn"]['cancel'].hide()
@@ -710,24 +943,19 @@ class MainWindow(QMainWindow):
 
     def remove_completed_from_download_list(self):
         with download_queue_lock:
-            check_row = 0
-            while check_row < self.tbl_dl_progress.rowCount():
-                local_id = self.tbl_dl_progress.item(check_row, 0).text()
-                logger.debug(f'Removing Row: {check_row} and mediaid: {local_id}')
-                if local_id in download_queue:
-                    if download_queue[local_id]['item_status'] in (
-                                "Cancelled",
-                                "Deleted",
-                                "Downloaded",
-                                "Already Exists"
-                            ):
-                        logger.debug(f'Removing Row: {check_row} and mediaid: {local_id}')
-                        self.tbl_dl_progress.removeRow(check_row)
-                        download_queue.pop(local_id)
-                    else:
-                        check_row += 1
-                else:
-                    check_row += 1
+            completed_rows = []
+            for row, local_id in enumerate(self.download_row_ids):
+                if local_id in download_queue and download_queue[local_id]['item_status'] in COMPLETED_STATUSES:
+                    completed_rows.append((row, local_id))
+
+            # Remove bottom up so the remaining indexes stay valid, with a single repaint at the end
+            self.tbl_dl_progress.setUpdatesEnabled(False)
+            for row, local_id in reversed(completed_rows):
+                logger.debug(f'Removing Row: {row} and mediaid: {local_id}')
+                self.tbl_dl_progress.removeRow(row)
+                del self.download_row_ids[row]
+                download_queue.pop(local_id)
+            self.tbl_dl_progress.setUpdatesEnabled(True)
 
 
     def cancel_all_downloads(self):
@@ -735,37 +963,50 @@ class MainWindow(QMainWindow):
             parsing.clear()
         with pending_lock:
             pending.clear()
+        # Translate and style once, not for every row
+        cancelled_text = self.tr("Cancelled")
+        cancelled_style = get_status_style("cancelled")
+        # Only flip statuses under the lock so download workers are not held up by widget updates
+        cancelled = []
         with download_queue_lock:
-            row_count = self.tbl_dl_progress.rowCount()
-            while row_count > 0:
-                for local_id in download_queue.keys():
-                    logger.debug(f'Trying to cancel : {local_id}')
-                    if download_queue[local_id]['item_status'] == "Waiting":
-                        download_queue[local_id]['item_status'] = "Cancelled"
-                        download_queue[local_id]['gui']['status_label'].setText(self.tr("Cancelled"))
-                        download_queue[local_id]['gui']['status_label'].setStyleSheet(get_status_style("cancelled"))
-                        download_queue[local_id]['gui']['progress_bar'].setValue(0)
-                        download_queue[local_id]['gui']["btn"]['cancel'].hide()
-                        download_queue[local_id]['gui']["btn"]['retry'].show()
-                    row_count -= 1
-                self.update_table_visibility()
+            for local_id, item in download_queue.items():
+                logger.debug(f'Trying to cancel : {local_id}')
+                if item['item_status'] == "Waiting":
+                    item['item_status'] = "Cancelled"
+                    cancelled.append(item['gui'])
+
+        self.tbl_dl_progress.setUpdatesEnabled(False)
+        for gui in cancelled:
+            gui['status_label'].setText(cancelled_text)
+            gui['status_label'].setStyleSheet(cancelled_style)
+            gui['progress_bar'].setValue(0)
+            gui["btn"]['cancel'].hide()
+            gui["btn"]['retry'].show()
+        self.update_table_visibility()
+        self.tbl_dl_progress.setUpdatesEnabled(True)
 
 
     def retry_cancelled_and_failed_downloads(self):
+        waiting_text = self.tr("Waiting")
+        waiting_style = get_status_style("waiting")
+        progress_bar_style = get_progress_bar_style()
+        retried = []
         with download_queue_lock:
-            row_count = self.tbl_dl_progress.rowCount()
-            while row_count > 0:
-                for local_id in download_queue.keys():
-                    logger.debug(f'Retrying : {local_id}')
-                    if download_queue[local_id]['item_status'] in ("Failed", "Cancelled"):
-                        download_queue[local_id]['item_status'] = "Waiting"
-                        download_queue[local_id]['gui']['status_label'].setText(self.tr("Waiting"))
-                        download_queue[local_id]['gui']['status_label'].setStyleSheet(get_status_style("waiting"))
-                        download_queue[local_id]['gui']['progress_bar'].setStyleSheet(get_progress_bar_style())
-                        download_queue[local_id]['gui']["btn"]['cancel'].show()
-                        download_queue[local_id]['gui']["btn"]['retry'].hide()
-                    row_count -= 1
-                self.update_table_visibility()
+            for local_id, item in download_queue.items():
+                logger.debug(f'Retrying : {local_id}')
+                if item['item_status'] in ("Failed", "Cancelled"):
+                    item['item_status'] = "Waiting"
+                    retried.append(item['gui'])
+
+        self.tbl_dl_progress.setUpdatesEnabled(False)
+        for gui in retried:
+            gui['status_label'].setText(waiting_text)
+            gui['status_label'].setStyleSheet(waiting_style)
+            gui['progress_bar'].setStyleSheet(progress_bar_style)
+            gui["btn"]['cancel'].show()
+            gui["btn"]['retry'].hide()
+        self.update_table_visibility()
+        self.tbl_dl_progress.setUpdatesEnabled(True)
 
 
     def user_table_remove_click(self):
@@ -777,17 +1018,16 @@ class MainWindow(QMainWindow):
         accounts = config.get('accounts').copy()
         del accounts[index]
         config.set('accounts', accounts)
-        config.save()
 
         self.tbl_sessions.removeRow(index)
         if config.get('active_account_number') == index or config.get('active_account_number') >= len(account_pool):
             config.set('active_account_number', 0)
-            config.save()
             try:
                 self.tbl_sessions.cellWidget(0, 0).setChecked(True)
             except AttributeError:
                 # Account Table is empty
                 pass
+        config.save()
         self.show_popup_dialog(self.tr("Account was removed successfully."))
 
 
@@ -795,177 +1035,112 @@ class MainWindow(QMainWindow):
         save_config(self)
 
 
+    def apply_login_layout(self, button_text, on_click, username=None, password=None):
+        # username and password are (label, placeholder) pairs, None hides the field
+        for label, field, texts in (
+            (self.login_username_label, self.login_username, username),
+            (self.login_password_label, self.login_password, password)
+        ):
+            if texts is None:
+                label.hide()
+                field.hide()
+            else:
+                set_text_if_changed(label, texts[0])
+                field.setPlaceholderText(texts[1])
+                label.show()
+                field.show()
+        try:
+            self.btn_login_add.clicked.disconnect()
+        except TypeError:
+            # Default value does not have disconnect
+            pass
+        self.btn_login_add.show()
+        self.btn_login_add.setIcon(QIcon())
+        self.btn_login_add.setText(button_text)
+        self.btn_login_add.clicked.connect(on_click)
+
+
     def set_login_fields(self):
         self.lb_generic_extractors.hide()
+        index = self.login_service.currentIndex()
+        email = (self.tr("Email"), "Enter your email")
+        password = (self.tr("Password"), "Enter your password")
 
         # Apple Music
-        if self.login_service.currentIndex() == 1:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.show()
-            self.login_password.setPlaceholderText("Enter your media-user-token")
-            self.login_password_label.setText(self.tr("Media User Token"))
-            self.login_password.show()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        if index == 1:
+            self.apply_login_layout(self.tr("Add Account"), lambda:
                 (self.show_popup_dialog(self.tr("Account added, please restart the app.")) or True) and
                 apple_music_add_account(self.login_password.text()) and
-                self.login_password.clear()
+                self.login_password.clear(),
+                password=(self.tr("Media User Token"), "Enter your media-user-token")
                 )
 
         # Bandcamp
-        elif self.login_service.currentIndex() == 2:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.hide()
-            self.login_password.hide()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Bandcamp Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 2:
+            self.apply_login_layout(self.tr("Add Bandcamp Account"), lambda:
                 (self.show_popup_dialog(self.tr("Public account added, please restart the app.\nLogging into personal accounts is currently unsupported, if you have any premium purchases please consider lending it to the dev team.")) or True) and
                 bandcamp_add_account()
                 )
 
         # Deezer
-        elif self.login_service.currentIndex() == 3:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.show()
-            self.login_password.setPlaceholderText("Enter your arl")
-            self.login_password_label.setText(self.tr("ARL"))
-            self.login_password.show()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 3:
+            self.apply_login_layout(self.tr("Add Account"), lambda:
                 (self.show_popup_dialog(self.tr("Account added, please restart the app.")) or True) and
                 deezer_add_account(self.login_password.text()) and
-                self.login_password.clear()
+                self.login_password.clear(),
+                password=(self.tr("ARL"), "Enter your arl")
                 )
 
         # Qobuz
-        elif self.login_service.currentIndex() == 4:
-            self.login_username_label.show()
-            self.login_username_label.setText(self.tr("Email"))
-            self.login_username.show()
-            self.login_username.setPlaceholderText("Enter your email")
-            self.login_password_label.show()
-            self.login_password_label.setText(self.tr("Password"))
-            self.login_password.show()
-            self.login_password.setPlaceholderText("Enter your password")
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 4:
+            self.apply_login_layout(self.tr("Add Account"), lambda:
                 qobuz_add_account(self.login_username.text(), self.login_password.text()) and
                 (self.show_popup_dialog(self.tr("Account added, please restart the app.")) or True) and
                 self.login_username.clear() and
-                self.login_password.clear()
+                self.login_password.clear(),
+                username=email, password=password
                 )
 
         # Soundcloud
-        elif self.login_service.currentIndex() == 5:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.show()
-            self.login_password_label.setText(self.tr("OAuth Token"))
-            self.login_password.show()
-            self.login_password.setPlaceholderText("Enter your oauth_token")
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 5:
+            self.apply_login_layout(self.tr("Add Account"), lambda:
                 (self.show_popup_dialog(self.tr("Account added, please restart the app.")) or True) and
                 soundcloud_add_account(oauth_token=self.login_password.text()) and
-                self.login_password.clear()
+                self.login_password.clear(),
+                password=(self.tr("OAuth Token"), "Enter your oauth_token")
                 )
 
         # Spotify
-        elif self.login_service.currentIndex() == 6:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.hide()
-            self.login_password.hide()
-            try:
-                self.btn_login_add.clicked.disconnect()
-            except TypeError:
-                # Default value does not have disconnect
-                pass
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Spotify Account"))
-            self.btn_login_add.clicked.connect(self.add_spotify_account)
+        elif index == 6:
+            self.apply_login_layout(self.tr("Add Spotify Account"), self.add_spotify_account)
 
         # Tidal
-        elif self.login_service.currentIndex() == 7:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.hide()
-            self.login_password.hide()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Tidal Account"))
-            self.btn_login_add.clicked.connect(self.add_tidal_account)
+        elif index == 7:
+            self.apply_login_layout(self.tr("Add Tidal Account"), self.add_tidal_account)
 
         # Youtube Music
-        elif self.login_service.currentIndex() == 8:
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.hide()
-            self.login_password.hide()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Youtube Music Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 8:
+            self.apply_login_layout(self.tr("Add Youtube Music Account"), lambda:
                 (self.show_popup_dialog(self.tr("Public account added, please restart the app.")) or True) and
                 youtube_music_add_account()
                 )
 
         # Crunchyroll
-        elif self.login_service.currentIndex() == 10:
-            self.login_username_label.show()
-            self.login_username_label.setText(self.tr("Email"))
-            self.login_username.show()
-            self.login_username.setPlaceholderText("Enter your email")
-            self.login_password_label.show()
-            self.login_password_label.setText(self.tr("Password"))
-            self.login_password.show()
-            self.login_password.setPlaceholderText("Enter your password")
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Account"))
-            self.btn_login_add.clicked.connect(lambda:
+        elif index == 10:
+            self.apply_login_layout(self.tr("Add Account"), lambda:
                 (self.show_popup_dialog(self.tr("Account added, please restart the app.")) or True) and
                 crunchyroll_add_account(self.login_username.text(), self.login_password.text()) and
                 self.login_username.clear() and
-                self.login_password.clear()
+                self.login_password.clear(),
+                username=email, password=password
                 )
 
         # Generic (yt-dlp)
-        elif self.login_service.currentIndex() == 11:
+        elif index == 11:
             self.groupbox_generic_audio_download_path.show()
             self.lb_generic_extractors.show()
             self.lb_generic_extractors.setText(self.tr("<strong>The following services are officially supported by the Generic Downloader. Even if your website is not officially supported, generic downloader may be able to download media off it anyway.</strong><br>{0}").format('<br>'.join(generic_list_extractors())))
-            self.login_username_label.hide()
-            self.login_username.hide()
-            self.login_password_label.hide()
-            self.login_password.hide()
-            self.btn_login_add.clicked.disconnect()
-            self.btn_login_add.show()
-            self.btn_login_add.setIcon(QIcon())
-            self.btn_login_add.setText(self.tr("Add Generic Downloader"))
-            self.btn_login_add.clicked.connect(lambda:
+            self.apply_login_layout(self.tr("Add Generic Downloader"), lambda:
                 (self.show_popup_dialog(self.tr("Generic Downloader added, please restart the app.")) or True) and
                 generic_add_account()
                 )
@@ -976,22 +1151,7 @@ class MainWindow(QMainWindow):
         self.btn_login_add.setDisabled(True)
         self.login_service.setDisabled(True)
         self.show_popup_dialog(self.tr("Login Service Started...\nSelect 'OnTheSpot' under devices in the Spotify Desktop App."))
-        login_worker = threading.Thread(target=self.add_spotify_account_worker)
-        login_worker.daemon = True
-        login_worker.start()
-
-
-    def add_spotify_account_worker(self):
-        if spotify_new_session():
-            self.show_popup_dialog(self.tr("Account added, please restart the app."))
-            self.btn_login_add.setText(self.tr("Please Restart The App"))
-            config.set('active_account_number', len(account_pool))
-            config.save()
-        else:
-            self.show_popup_dialog(self.tr("Account already exists."))
-            self.btn_login_add.setText(self.tr("Add Account"))
-        self.login_service.setDisabled(False)
-        self.btn_login_add.setDisabled(False)
+        self.login_pool.start(LoginTask(self.account_added, spotify_new_session))
 
 
     def add_tidal_account(self):
@@ -1001,13 +1161,11 @@ class MainWindow(QMainWindow):
         self.login_service.setDisabled(True)
         device_code, verification_url = tidal_add_account_pt1()
         self.show_popup_dialog(self.tr(f"Login Service Started head to <a style='color: #6495ed;' href='https://{verification_url}'>https://{verification_url}</a> to continue."))
-        login_worker = threading.Thread(target=self.add_tidal_account_worker, args=(device_code,))
-        login_worker.daemon = True
-        login_worker.start()
+        self.login_pool.start(LoginTask(self.account_added, tidal_add_account_pt2, device_code))
 
 
-    def add_tidal_account_worker(self, device_code):
-        if tidal_add_account_pt2(device_code):
+    def account_add_finished(self, added):
+        if added:
             self.show_popup_dialog(self.tr("Account added, please restart the app."))
             self.btn_login_add.setText(self.tr("Please Restart The App"))
             config.set('active_account_number', len(account_pool))
@@ -1020,8 +1178,10 @@ class MainWindow(QMainWindow):
 
 
     def fill_search_table(self):
-        while self.tbl_search_results.rowCount() > 0:
-            self.tbl_search_results.removeRow(0)
+        # Search requests and response parsing run on a worker thread so the UI stays responsive
+        if self.search_worker and self.search_worker.isRunning():
+            return
+        self.tbl_search_results.setRowCount(0)
         search_term = self.search_term.text().strip()
         content_types = []
         if self.enable_search_tracks.isChecked():
@@ -1039,7 +1199,14 @@ class MainWindow(QMainWindow):
         if self.enable_search_audiobooks.isChecked():
             content_types.append('audiobook')
 
-        results = get_search_results(search_term, content_types)
+        self.btn_search.setEnabled(False)
+        self.search_worker = SearchWorker(search_term, content_types)
+        self.search_worker.results_ready.connect(self.show_search_results)
+        self.search_worker.start()
+
+
+    def show_search_results(self, results):
+        self.btn_search.setEnabled(True)
         if results is None:
             self.show_popup_dialog(self.tr("You need to login to at least one account to use this feature."))
             self.search_term.setText('')
@@ -1070,11 +1237,20 @@ class MainWindow(QMainWindow):
             QApplication.clipboard().setText(item_url)
             self.show_popup_dialog(self.tr("The URL has been copied to the clipboard."), download=True)
 
-        for result in results:
+        download_icon = self.get_icon('download')
+        link_icon = self.get_icon('link')
+        theme = config.get('theme')
+        show_thumbnails = config.get('show_search_thumbnails')
+        thumbnail_size = config.get("thumbnail_size")
+
+        # Size the table once and fill rows in place, inserting row by row relayouts every time
+        self.tbl_search_results.setUpdatesEnabled(False)
+        self.tbl_search_results.setRowCount(len(results))
+        for row, result in enumerate(results):
             download_btn = QPushButton(self.tbl_search_results)
-            download_btn.setIcon(self.get_icon('download'))
+            download_btn.setIcon(download_icon)
             download_btn.setMinimumHeight(30)
-            download_btn.setStyleSheet(config.get('theme'))
+            download_btn.setStyleSheet(theme)
             download_btn.clicked.connect(lambda x,
                                     item_name=result['item_name'],
                                     item_url=result['item_url'],
@@ -1085,9 +1261,9 @@ class MainWindow(QMainWindow):
                                     )
 
             copy_btn = QPushButton(self.tbl_search_results)
-            copy_btn.setIcon(self.get_icon('link'))
+            copy_btn.setIcon(link_icon)
             copy_btn.setMinimumHeight(30)
-            copy_btn.setStyleSheet(config.get('theme'))
+            copy_btn.setStyleSheet(theme)
             copy_btn.clicked.connect(lambda x, item_url=result['item_url']: copy_btn_clicked(item_url))
 
             btn_layout = QHBoxLayout()
@@ -1103,49 +1279,59 @@ class MainWindow(QMainWindow):
             service = QTableWidgetItem(result['item_service'].replace('_', ' ').title())
             service.setIcon(self.get_icon(result["item_service"]))
 
-            rows = self.tbl_search_results.rowCount()
-            self.tbl_search_results.insertRow(rows)
-
-            if config.get('show_search_thumbnails'):
-                self.tbl_search_results.setRowHeight(rows, config.get("thumbnail_size"))
+            if show_thumbnails:
+                self.tbl_search_results.setRowHeight(row, thumbnail_size)
                 item_label = LabelWithThumb(result['item_name'], result['item_thumbnail_url'])
             else:
                 item_label = QLabel(self.tbl_dl_progress)
                 item_label.setText(result['item_name'])
             item_label.setStyleSheet("background-color: transparent;")
 
-            self.tbl_search_results.setCellWidget(rows, 0, item_label)
-            self.tbl_search_results.setItem(rows, 1, QTableWidgetItem(str(result['item_by'])))
-            self.tbl_search_results.setItem(rows, 2, QTableWidgetItem(result['item_type'].replace('podcast_', '').title()))
-            self.tbl_search_results.setItem(rows, 3, service)
-            self.tbl_search_results.setCellWidget(rows, 4, btn_widget)
+            self.tbl_search_results.setCellWidget(row, 0, item_label)
+            self.tbl_search_results.setItem(row, 1, QTableWidgetItem(str(result['item_by'])))
+            self.tbl_search_results.setItem(row, 2, QTableWidgetItem(result['item_type'].replace('podcast_', '').title()))
+            self.tbl_search_results.setItem(row, 3, service)
+            self.tbl_search_results.setCellWidget(row, 4, btn_widget)
+        self.tbl_search_results.setUpdatesEnabled(True)
+
+        if results:
             self.tbl_search_results.horizontalHeader().resizeSection(0, 450)
             self.tbl_search_results.horizontalHeader().resizeSection(4, 100)
-
             self.search_term.setText('')
 
 
-    def update_table_visibility(self):
-        show_waiting = self.download_queue_show_waiting.isChecked()
-        show_failed = self.download_queue_show_failed.isChecked()
-        show_unavailable = self.download_queue_show_unavailable.isChecked()
-        show_cancelled = self.download_queue_show_cancelled.isChecked()
-        show_completed = self.download_queue_show_completed.isChecked()
+    def get_hidden_statuses(self):
+        hidden_statuses = set()
+        if not self.download_queue_show_waiting.isChecked():
+            hidden_statuses.add(self.tr("Waiting"))
+        if not self.download_queue_show_failed.isChecked():
+            hidden_statuses.add(self.tr("Failed"))
+        if not self.download_queue_show_unavailable.isChecked():
+            hidden_statuses.add(self.tr("Unavailable"))
+        if not self.download_queue_show_cancelled.isChecked():
+            hidden_statuses.add(self.tr("Cancelled"))
+        if not self.download_queue_show_completed.isChecked():
+            hidden_statuses.add(self.tr("Already Exists"))
+            hidden_statuses.add(self.tr("Downloaded"))
+        return hidden_statuses
+
 
+    def update_table_visibility(self):
+        hidden_statuses = self.get_hidden_statuses()
+        # With no filters active now or on the last pass every row is already shown,
+        # a status change cannot hide anything
+        if not hidden_statuses and not self.last_hidden_statuses:
+            return
+        self.last_hidden_statuses = hidden_statuses
+        # Relayout and repaint once for the whole pass rather than per hidden or shown row
+        updates_enabled = self.tbl_dl_progress.updatesEnabled()
+        self.tbl_dl_progress.setUpdatesEnabled(False)
         for row in range(self.tbl_dl_progress.rowCount()):
             label = self.tbl_dl_progress.cellWidget(row, 5)  # Check the Status column
             if label:
-                status = label.text()
                 # Determine visibility based on checkboxes
-                if (status == self.tr("Waiting") and not show_waiting) or \
-                   (status == self.tr("Failed") and not show_failed) or \
-                   (status == self.tr("Unavailable") and not show_unavailable) or \
-                   (status == self.tr("Cancelled") and not show_cancelled) or \
-                   (status == self.tr("Already Exists") and not show_completed) or \
-                   (status == self.tr("Downloaded") and not show_completed):
-                    self.tbl_dl_progress.hideRow(row)  # Hide the row
-                else:
-                    self.tbl_dl_progress.showRow(row)  # Show the row if the status is allowed
+                self.tbl_dl_progress.setRowHidden(row, label.text() in hidden_statuses)
+        self.tbl_dl_progress.setUpdatesEnabled(updates_enabled)
 
 
     def manage_mirror_spotify_playback(self):
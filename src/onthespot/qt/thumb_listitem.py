@@ -4,6 +4,20 @@ from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkRepl
 from PyQt6.QtWidgets import QLabel, QHBoxLayout, QWidget
 from ..otsconfig import config
 
+THUMBNAIL_CACHE_SIZE = 512
+network_manager = None
+thumbnail_cache = {}
+
+
+def get_network_manager():
+    # One manager for every thumbnail, a manager per row opened its own connections and
+    # wakeup pipes and ran out of file descriptors on large queues
+    global network_manager
+    if network_manager is None:
+        network_manager = QNetworkAccessManager()
+    return network_manager
+
+
 class LabelWithThumb(QWidget):
     def __init__(self, label, thumb_url):
         super().__init__()
@@ -26,13 +40,16 @@ class LabelWithThumb(QWidget):
         self.image_label = QLabel(self)
         self.image_label.setFixedSize(self.aspect_ratio, self.aspect_ratio)  # Set fixed size for the image label
 
-        # Create QNetworkAccessManager
-        self.manager = QNetworkAccessManager(self)
-        request = QNetworkRequest(QUrl(thumb_url))
-
-        # Connect the finished signal to the slot
-        self.manager.finished.connect(self.on_finished)
-        self.manager.get(request)  # Make the request
+        # Albums and playlists repeat the same artwork, reuse the scaled pixmap
+        self.cache_key = (thumb_url, self.aspect_ratio)
+        pixmap = thumbnail_cache.get(self.cache_key)
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+        else:
+            self.reply = get_network_manager().get(QNetworkRequest(QUrl(thumb_url)))
+            # Parent the reply to the row so it is aborted and freed if the row goes away first
+            self.reply.setParent(self)
+            self.reply.finished.connect(self.on_finished)
 
         # Add both labels to the layout
         layout.addWidget(self.image_label)
@@ -41,8 +58,9 @@ class LabelWithThumb(QWidget):
         self.setLayout(layout)
 
 
-    def on_finished(self, reply: QNetworkReply):
+    def on_finished(self):
         # This method is called when the network request is completed
+        reply = self.reply
         if reply.error() == QNetworkReply.NetworkError.NoError:  # Correct error checking
             # Read the image data and create a pixmap
             image_data = reply.readAll()
@@ -52,6 +70,10 @@ class LabelWithThumb(QWidget):
             scaled_pixmap = pixmap.scaled(self.aspect_ratio, self.aspect_ratio, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.image_label.setPixmap(scaled_pixmap)  # Update the QLabel with the pixmap
 
+            if len(thumbnail_cache) >= THUMBNAIL_CACHE_SIZE:
+                thumbnail_cache.pop(next(iter(thumbnail_cache)))
+            thumbnail_cache[self.cache_key] = scaled_pixmap
+
         # Mark request for deletion
-        self.manager.deleteLater()
         reply.deleteLater()
+        self.reply = None
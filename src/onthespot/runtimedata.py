@@ -2,10 +2,12 @@ import linecache
 import logging
 import os
 import sys
+import time
 import tracemalloc
 from functools import wraps
 from logging.handlers import RotatingFileHandler
-from threading import Lock
+from threading import Condition, Event, Lock
+from PyQt6.QtCore import QObject, pyqtSignal
 from .otsconfig import config
 
 log_formatter = logging.Formatter(
@@ -29,6 +31,19 @@ download_queue = {}
 parsing_lock = Lock()
 pending_lock = Lock()
 download_queue_lock = Lock()
+shutdown_event = Event()
+# Notified whenever an item is added to pending, queue workers wait on it instead of polling
+pending_condition = Condition(pending_lock)
+
+PENDING_RETRY_MAX_DELAY = 60  # seconds
+
+
+class PendingSignals(QObject):
+    # Emitted alongside pending_condition so the GUI dispatches queued items without polling
+    item_added = pyqtSignal()
+
+
+pending_signals = PendingSignals()
 
 init_tray = False
 
@@ -42,6 +57,30 @@ def get_init_tray():
     return init_tray
 
 
+def notify_pending():
+    # Caller must hold pending_lock
+    pending_condition.notify()
+    pending_signals.item_added.emit()
+
+
+def retry_pending_item(item):
+    # Back off exponentially so a dead endpoint is not hammered by every queue worker
+    item['_retry_count'] = item.get('_retry_count', 0) + 1
+    item['_retry_at'] = time.time() + min(PENDING_RETRY_MAX_DELAY, 2 ** item['_retry_count'])
+    with pending_condition:
+        pending[item['local_id']] = item
+        notify_pending()
+
+
+def get_ready_pending_id():
+    # Caller must hold pending_lock
+    now = time.time()
+    for local_id, item in pending.items():
+        if item.get('_retry_at', 0) <= now:
+            return local_id
+    return None
+
+
 loglevel = int(os.environ.get("LOG_LEVEL", 20))
 
 
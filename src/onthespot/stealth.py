@@ -3,10 +3,12 @@ Stealth Mode - Avoid detection when downloading from Apple Music
 Simulates human-like listening behavior with delays and limits.
 """
 
+import atexit
 import json
 import random
+import threading
 import time
-from datetime import datetime, date
+from datetime import date
 from pathlib import Path
 from .otsconfig import config
 from .runtimedata import get_logger
@@ -15,10 +17,29 @@ logger = get_logger("stealth")
 
 # Stats file location
 STATS_FILE = Path.home() / '.config' / 'onthespot' / 'stealth_stats.json'
+STATS_FLUSH_INTERVAL = 10  # seconds
+
+# Stats live in memory, the file is only read once and written at most every flush interval
+_stats = None
+_stats_dirty = False
+_flush_timer = None
+_stats_lock = threading.Lock()
 
 
 def _load_stats():
-    """Load daily stats from file."""
+    """Load daily stats."""
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = _read_stats()
+        # Reset if it's a new day
+        if _stats.get('date') != str(date.today()):
+            _stats = _reset_stats()
+        return _stats
+
+
+def _read_stats():
+    """Read daily stats from file."""
     try:
         if STATS_FILE.exists():
             data = json.loads(STATS_FILE.read_text())
@@ -37,27 +58,49 @@ def _reset_stats():
         'date': str(date.today()),
         'tracks_today': 0,
         'tracks_this_hour': 0,
-        'hour': datetime.now().hour,
+        'hour': time.localtime().tm_hour,
         'session_tracks': 0,
         'last_download_time': 0
     }
 
 
 def _save_stats(stats):
-    """Save stats to file."""
+    """Save stats, writes during a burst of downloads are coalesced into one."""
+    global _stats, _stats_dirty, _flush_timer
+    with _stats_lock:
+        _stats = stats
+        _stats_dirty = True
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(STATS_FLUSH_INTERVAL, flush_stats)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_stats():
+    """Write pending stats to file."""
+    global _stats_dirty, _flush_timer
+    with _stats_lock:
+        _flush_timer = None
+        if not _stats_dirty:
+            return
+        _stats_dirty = False
+        data = json.dumps(_stats, indent=2)
     try:
         STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        STATS_FILE.write_text(json.dumps(stats, indent=2))
+        STATS_FILE.write_text(data)
     except Exception as e:
         logger.warning(f"Failed to save stealth stats: {e}")
 
 
+atexit.register(flush_stats)
+
+
 def get_stealth_stats():
     """Get current stealth mode statistics."""
     stats = _load_stats()
     
     # Reset hourly count if hour changed
-    current_hour = datetime.now().hour
+    current_hour = time.localtime().tm_hour
     if stats.get('hour') != current_hour:
         stats['hour'] = current_hour
         stats['tracks_this_hour'] = 0
@@ -76,7 +119,7 @@ def can_download():
     # Check hourly limit
     max_per_hour = config.get('stealth_max_tracks_per_hour', 20)
     if stats['tracks_this_hour'] >= max_per_hour:
-        minutes_left = 60 - datetime.now().minute
+        minutes_left = 60 - time.localtime().tm_min
         return False, f"Hourly limit reached ({max_per_hour}/hr). Wait ~{minutes_left} min."
     
     # Check daily limit
@@ -2,6 +2,9 @@
 Modern Spotify-inspired UI Theme for OnTheSpot
 Features: Dark theme, customizable accents, rounded corners, smooth animations
 """
+import re
+from functools import lru_cache
+from types import MappingProxyType
 
 # Default accent color (Spotify Green)
 _custom_accent = None
@@ -9,32 +12,48 @@ _custom_accent = None
 def set_accent_color(color_hex):
     """Set a custom accent color for the theme."""
     global _custom_accent
+    if color_hex == _custom_accent:
+        return
     _custom_accent = color_hex
+    # Every cached style embeds the palette, clear them together. The palette and the
+    # lighten/darken helpers are keyed by color so they stay valid.
+    get_complete_theme.cache_clear()
+    _get_status_styles.cache_clear()
+    get_status_style.cache_clear()
+    get_progress_bar_style.cache_clear()
+    get_button_style.cache_clear()
+    get_item_label_style.cache_clear()
+    get_status_bar_label_style.cache_clear()
 
 def get_accent_color():
     """Get the current accent color."""
     return _custom_accent or '#1DB954'
 
+@lru_cache(maxsize=128)
+def _shift_color(hex_color, delta):
+    """Add delta to each channel of a hex color, clamped to 0-255."""
+    value = int(hex_color.lstrip('#'), 16)
+    r = max(0, min(255, (value >> 16 & 0xff) + delta))
+    g = max(0, min(255, (value >> 8 & 0xff) + delta))
+    b = max(0, min(255, (value & 0xff) + delta))
+    return '#%06x' % (r << 16 | g << 8 | b)
+
 def _lighten_color(hex_color, percent=20):
     """Lighten a hex color by a percentage."""
-    hex_color = hex_color.lstrip('#')
-    r = min(255, int(hex_color[0:2], 16) + int(255 * percent / 100))
-    g = min(255, int(hex_color[2:4], 16) + int(255 * percent / 100))
-    b = min(255, int(hex_color[4:6], 16) + int(255 * percent / 100))
-    return f'#{r:02x}{g:02x}{b:02x}'
+    return _shift_color(hex_color, int(255 * percent / 100))
 
 def _darken_color(hex_color, percent=20):
     """Darken a hex color by a percentage."""
-    hex_color = hex_color.lstrip('#')
-    r = max(0, int(hex_color[0:2], 16) - int(255 * percent / 100))
-    g = max(0, int(hex_color[2:4], 16) - int(255 * percent / 100))
-    b = max(0, int(hex_color[4:6], 16) - int(255 * percent / 100))
-    return f'#{r:02x}{g:02x}{b:02x}'
+    return _shift_color(hex_color, -int(255 * percent / 100))
 
 def get_colors():
     """Get the color palette with current accent color."""
-    accent = get_accent_color()
-    return {
+    return _get_palette(get_accent_color())
+
+@lru_cache(maxsize=8)
+def _get_palette(accent):
+    """Build the color palette for an accent color, read-only since it is shared between callers."""
+    return MappingProxyType({
         'background': '#121212',
         'background_alt': '#181818',
         'background_elevated': '#282828',
@@ -52,7 +71,7 @@ def get_colors():
         'error': '#ef4444',
         'info': '#3b82f6',
         'progress_bg': '#404040',
-    }
+    })
 
 # For backwards compatibility
 COLORS = get_colors()
@@ -542,17 +561,27 @@ def get_modern_theme_part3():
     }}
 """
 
+@lru_cache(maxsize=1)
 def get_complete_theme():
     """Returns the complete stylesheet."""
-    return get_modern_theme() + get_modern_theme_part2() + get_modern_theme_part3()
+    return _minify_css(get_modern_theme() + get_modern_theme_part2() + get_modern_theme_part3())
+
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,])\s*')
+
+def _minify_css(css):
+    """Strip comments and layout whitespace, Qt reparses the whole sheet on every setStyleSheet."""
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_WHITESPACE_RE.sub(' ', css)
+    return _CSS_PUNCTUATION_RE.sub(r'\1', css).strip()
 
 
 # Status badge styles for download queue
-def get_status_style(status):
-    """Returns the style for a given download status."""
-    # Height controlled via stylesheet so hot-reload works
-    # min/max-height constrains the label size
-    base_style = '''
+# Height controlled via stylesheet so hot-reload works
+# min/max-height constrains the label size
+STATUS_BADGE_STYLE = '''
         padding: 0px 8px;
         border-radius: 3px;
         font-weight: bold;
@@ -562,47 +591,61 @@ def get_status_style(status):
         max-height: 20px;
     '''
 
-    styles = {
-        'downloading': f'background-color: {COLORS["info"]}; color: #ffffff; {base_style}',
-        'completed': f'background-color: {COLORS["success"]}; color: #ffffff; {base_style}',
-        'downloaded': f'background-color: {COLORS["success"]}; color: #ffffff; {base_style}',
-        'failed': f'background-color: {COLORS["error"]}; color: #ffffff; {base_style}',
-        'waiting': f'background-color: {COLORS["warning"]}; color: #000000; {base_style}',
-        'cancelled': f'background-color: {COLORS["text_muted"]}; color: #ffffff; {base_style}',
-        'already exists': f'background-color: {COLORS["text_muted"]}; color: #ffffff; {base_style}',
-        'rate limited': f'background-color: {COLORS["warning"]}; color: #000000; {base_style}',
-        'converting': f'background-color: {COLORS["info"]}; color: #ffffff; {base_style}',
-        'getting info': f'background-color: {COLORS["info"]}; color: #ffffff; {base_style}',
-        'unavailable': f'background-color: {COLORS["error"]}; color: #ffffff; {base_style}',
+# Partial matches for composite statuses (e.g., "✓ Done · Wait 1m 30s"), checked in order
+STATUS_KEYWORDS = (
+    ('done', 'completed'),
+    ('wait', 'stealth waiting'),
+    ('download', 'downloading'),
+    ('convert', 'converting'),
+    ('fail', 'failed'),
+    ('error', 'failed'),
+    ('cancel', 'cancelled'),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_status_styles():
+    """Build the badge style for every known status."""
+    return {
+        'downloading': f'background-color: {COLORS["info"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'completed': f'background-color: {COLORS["success"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'downloaded': f'background-color: {COLORS["success"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'failed': f'background-color: {COLORS["error"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'waiting': f'background-color: {COLORS["warning"]}; color: #000000; {STATUS_BADGE_STYLE}',
+        'cancelled': f'background-color: {COLORS["text_muted"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'already exists': f'background-color: {COLORS["text_muted"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'rate limited': f'background-color: {COLORS["warning"]}; color: #000000; {STATUS_BADGE_STYLE}',
+        'converting': f'background-color: {COLORS["info"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'getting info': f'background-color: {COLORS["info"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'unavailable': f'background-color: {COLORS["error"]}; color: #ffffff; {STATUS_BADGE_STYLE}',
+        'stealth waiting': f'background-color: #8b5cf6; color: #ffffff; {STATUS_BADGE_STYLE}',  # Purple
+        'default': f'background-color: {COLORS["background_elevated"]}; color: {COLORS["text_primary"]}; {STATUS_BADGE_STYLE}',
     }
 
+
+@lru_cache(maxsize=64)
+def get_status_style(status):
+    """Returns the style for a given download status."""
+    styles = _get_status_styles()
     if not status:
-        return f'background-color: {COLORS["background_elevated"]}; color: {COLORS["text_primary"]}; {base_style}'
+        return styles['default']
 
     status_lower = status.lower().strip()
 
     # Direct match first
-    if status_lower in styles:
-        return styles[status_lower]
-
-    # Check for partial matches (e.g., "✓ Done · Wait 1m 30s")
-    if 'done' in status_lower:
-        return styles['completed']
-    if 'wait' in status_lower:
-        return f'background-color: #8b5cf6; color: #ffffff; {base_style}'  # Purple for stealth waiting
-    if 'download' in status_lower:
-        return styles['downloading']
-    if 'convert' in status_lower:
-        return styles['converting']
-    if 'fail' in status_lower or 'error' in status_lower:
-        return styles['failed']
-    if 'cancel' in status_lower:
-        return styles['cancelled']
+    style = styles.get(status_lower)
+    if style is not None:
+        return style
+
+    for keyword, style_key in STATUS_KEYWORDS:
+        if keyword in status_lower:
+            return styles[style_key]
 
     # Default style
-    return f'background-color: {COLORS["background_elevated"]}; color: {COLORS["text_primary"]}; {base_style}'
+    return styles['default']
 
 
+@lru_cache(maxsize=8)
 def get_progress_bar_style(status='default'):
     """Returns progress bar style."""
     if status == 'completed':
@@ -633,6 +676,7 @@ def get_progress_bar_style(status='default'):
     """
 
 
+@lru_cache(maxsize=1)
 def get_button_style():
     """Returns button styling for action buttons."""
     return f"""
@@ -651,15 +695,26 @@ def get_button_style():
     """
 
 
+@lru_cache(maxsize=1)
+def get_item_label_style():
+    """Returns the style for item labels in the download queue."""
+    return f"background-color: transparent; color: {COLORS['text_primary']}; padding-left: 8px;"
+
+
+@lru_cache(maxsize=1)
+def get_status_bar_label_style():
+    """Returns the style for status bar labels."""
+    return f"color: {COLORS['text_secondary']}; padding: 0 15px;"
+
+
+@lru_cache(maxsize=1024)
 def format_duration(ms):
     """Format duration in milliseconds to MM:SS or HH:MM:SS."""
     if not ms:
         return "--:--"
     try:
-        total_seconds = int(ms) // 1000
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
+        hours, remainder = divmod(int(ms) // 1000, 3600)
+        minutes, seconds = divmod(remainder, 60)
         if hours > 0:
             return f"{hours}:{minutes:02d}:{seconds:02d}"
         return f"{minutes}:{seconds:02d}"
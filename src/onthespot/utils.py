@@ -15,9 +15,30 @@ import music_tag
 from .otsconfig import config
 from .runtimedata import get_logger, pending, download_queue
 
+# orjson is an optional speedup for parsing large API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger("utils")
 
 
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data):
+    """Serialize data to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
 class SSLAdapter(requests.adapters.HTTPAdapter):
     def __init__(self, ssl_context, *args, **kwargs):
         self.ssl_context = ssl_context
@@ -28,10 +49,23 @@ class SSLAdapter(requests.adapters.HTTPAdapter):
         return super().init_poolmanager(*args, ssl_context=context, **kwargs)
 
 
+def _get_req_cache_file(url):
+    request_key = md5(f'{url}'.encode()).hexdigest()
+    return request_key, os.path.join(config.get('_cache_dir'), 'reqcache', request_key + '.json')
+
+
+def prime_call_cache(url, data):
+    """Store an already fetched JSON response as the cached make_call result for url."""
+    request_key, req_cache_file = _get_req_cache_file(url)
+    os.makedirs(os.path.dirname(req_cache_file), exist_ok=True)
+    with open(req_cache_file, 'w', encoding='utf-8') as cf:
+        json.dump(data, cf)
+    logger.debug(f'URL "{url}" cache primed! HASH: {request_key}')
+
+
 def make_call(url, params=None, headers=None, session=None, skip_cache=False, text=False, use_ssl=False):
     if not skip_cache:
-        request_key = md5(f'{url}'.encode()).hexdigest()
-        req_cache_file = os.path.join(config.get('_cache_dir'), 'reqcache', request_key + '.json')
+        request_key, req_cache_file = _get_req_cache_file(url)
         os.makedirs(os.path.dirname(req_cache_file), exist_ok=True)
         if os.path.isfile(req_cache_file):
             logger.debug(f'URL "{url}" cache found! HASH: {request_key}')
@@ -39,7 +73,7 @@ def make_call(url, params=None, headers=None, session=None, skip_cache=False, te
                 with open(req_cache_file, 'r', encoding='utf-8') as cf:
                     if text:
                         return cf.read()
-                    json_data = json.load(cf)
+                    json_data = json_loads(cf.read())
                 return json_data
             except json.JSONDecodeError:
                 logger.error(f'URL "{url}" cache has invalid data')
@@ -62,7 +96,7 @@ def make_call(url, params=None, headers=None, session=None, skip_cache=False, te
                 cf.write(response.text)
         if text:
             return response.text
-        return json.loads(response.text)
+        return json_loads(response.content)
     else:
         logger.info(f"Request status error {response.status_code}: {url}")
         return None
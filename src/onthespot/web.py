@@ -7,7 +7,6 @@ import shutil
 import subprocess
 import sys
 import threading
-import time
 import traceback
 from flask import Flask, jsonify, render_template, redirect, request, send_file, url_for, flash, Response
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
@@ -25,8 +24,9 @@ from .api.generic import generic_add_account
 from .downloader import DownloadWorker, RetryWorker
 from .otsconfig import cache_dir, config_dir, config
 from .parse_item import parsingworker, parse_url
-from .runtimedata import get_logger, account_pool, pending, download_queue, download_queue_lock, pending_lock
+from .runtimedata import get_logger, account_pool, pending, download_queue, download_queue_lock, pending_lock, pending_condition, get_ready_pending_id, retry_pending_item
 from .search import get_search_results
+from .stealth import flush_stats
 from .utils import format_bytes
 
 logger = get_logger("web")
@@ -44,39 +44,39 @@ class QueueWorker(threading.Thread):
 
     def run(self):
         while True:
+            with pending_condition:
+                local_id = get_ready_pending_id()
+                while local_id is None:
+                    # Items backing off after a failure are rechecked every second
+                    pending_condition.wait(1 if pending else None)
+                    local_id = get_ready_pending_id()
+                item = pending.pop(local_id)
             try:
-                if pending:
-                    local_id = next(iter(pending))
-                    with pending_lock:
-                        item = pending.pop(local_id)
-                    token = get_account_token(item['item_service'])
-                    item_metadata = globals()[f"{item['item_service']}_get_{item['item_type']}_metadata"](token, item['item_id'])
-                    if item_metadata:
-                        with download_queue_lock:
-                            download_queue[local_id] = {
-                                'local_id': local_id,
-                                'available': True,
-                                "item_service": item["item_service"],
-                                "item_type": item["item_type"],
-                                'item_id': item['item_id'],
-                                'item_status': 'Waiting',
-                                "file_path": None,
-                                "item_name": item_metadata["title"],
-                                "item_by": item_metadata["artists"],
-                                'parent_category': item['parent_category'],
-                                'playlist_name': item.get('playlist_name'),
-                                'playlist_by': item.get('playlist_by'),
-                                'playlist_number': item.get('playlist_number'),
-                                'item_thumbnail': item_metadata["image_url"],
-                                'item_url': item_metadata["item_url"],
-                                'progress': 0
-                            }
-                else:
-                    time.sleep(0.2)
+                token = get_account_token(item['item_service'])
+                item_metadata = globals()[f"{item['item_service']}_get_{item['item_type']}_metadata"](token, item['item_id'])
+                if item_metadata:
+                    with download_queue_lock:
+                        download_queue[local_id] = {
+                            'local_id': local_id,
+                            'available': True,
+                            "item_service": item["item_service"],
+                            "item_type": item["item_type"],
+                            'item_id': item['item_id'],
+                            'item_status': 'Waiting',
+                            "file_path": None,
+                            "item_name": item_metadata["title"],
+                            "item_by": item_metadata["artists"],
+                            'parent_category': item['parent_category'],
+                            'playlist_name': item.get('playlist_name'),
+                            'playlist_by': item.get('playlist_by'),
+                            'playlist_number': item.get('playlist_number'),
+                            'item_thumbnail': item_metadata["image_url"],
+                            'item_url': item_metadata["item_url"],
+                            'progress': 0
+                        }
             except Exception as e:
                 logger.error(f"Unknown Exception for {item}: {str(e)}\nTraceback: {traceback.format_exc()}")
-                with pending_lock:
-                    pending[local_id] = item
+                retry_pending_item(item)
 
 class User(UserMixin):
     def __init__(self, id):
@@ -228,6 +228,8 @@ def restart():
     with open(os.path.join(cache_dir(), 'cached_download_queue.txt'), 'w') as file:
         for local_id, item in download_queue.items():
             file.write(item['item_url'] + '\n')
+    # os._exit skips atexit handlers, and the new process reads the stats file
+    flush_stats()
     logger.info("Restarting...")
     subprocess.Popen([sys.executable, '-m', 'onthespot.web'] + (sys.argv[1:]))
     os._exit(0)